@@ -24,17 +24,29 @@ on the SpatialBench queries at a specified scale factor.
 """
 
 import argparse
+import io
 import json
 import multiprocessing
+import os
 import signal
 import sys
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache, partial
+from itertools import takewhile
+from multiprocessing.connection import Connection, wait
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, TextIO
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
 # Add spatialbench-queries directory to path to import query modules
 # Use append (not insert) so installed packages like spatial_polars are found first
@@ -42,6 +54,7 @@ sys.path.append(str(Path(__file__).parent.parent / "spatialbench-queries"))
 
 # Constants
 QUERY_COUNT = 12
+QUERY_ORDER = tuple(f"q{i}" for i in range(1, QUERY_COUNT + 1))
 TABLES = ["building", "customer", "driver", "trip", "vehicle", "zone"]
 
 
@@ -50,10 +63,25 @@ class BenchmarkResult:
     """Result of a single query benchmark."""
     query: str
     engine: str
-    time_seconds: float | None
+    time_ns: int | None
     row_count: int | None
     status: str  # "success", "error", "timeout"
     error_message: str | None = None
+    runs: int = 1  # number of successful runs averaged into time_ns
+
+    @property
+    def time_seconds(self) -> float | None:
+        return None if self.time_ns is None else self.time_ns / 1e9
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "query": self.query,
+            # Timings are kept in nanoseconds and only rounded here, on output
+            "time_seconds": None if self.time_ns is None else round(self.time_seconds, 2),
+            "row_count": self.row_count,
+            "status": self.status,
+            "error_message": self.error_message,
+        }
 
 
 @dataclass
@@ -72,37 +100,93 @@ class BenchmarkSuite:
             "version": self.version,
             "scale_factor": self.scale_factor,
             "timestamp": self.timestamp,
-            "total_time": self.total_time,
-            "results": [
-                {
-                    "query": r.query,
-                    "time_seconds": r.time_seconds,
-                    "row_count": r.row_count,
-                    "status": r.status,
-                    "error_message": r.error_message,
-                }
-                for r in self.results
-            ],
+            "total_time": round(self.total_time, 2),
+            "results": [r.to_dict() for r in self.results],
         }
 
 
+@dataclass(frozen=True)
+class TableSource:
+    """Location of a table's parquet data, resolved once by the runner."""
+    path: str
+    is_dir: bool
+    read_pattern: str  # "<dir>/*.parquet" for directories, the file path otherwise
+
+
 class QueryTimeoutError(Exception):
     """Raised when a query times out."""
     pass
 
 
-def _run_query_in_process(
-        result_queue: multiprocessing.Queue,
-        engine_class: type,
-        data_paths: dict[str, str],
+class WorkerCrashedError(Exception):
+    """Raised when a worker process exits without sending its results."""
+
+    def __init__(self, exitcode: int | None):
+        self.exitcode = exitcode
+        if exitcode == -signal.SIGKILL:
+            description = "killed by SIGKILL, possibly by the OOM killer"
+        elif exitcode is not None and exitcode < 0:
+            description = f"killed by signal {signal.Signals(-exitcode).name}"
+        else:
+            description = f"process exit code: {exitcode}"
+        super().__init__(description)
+
+
+SHUTDOWN = "__shutdown__"
+
+
+def _execute_query(
+        benchmark: "BaseBenchmark",
         query_name: str,
         query_sql: str | None,
+        repeat: int = 1,
+) -> dict[str, Any]:
+    """Run one query ``repeat`` times inside the worker and describe the outcome.
+
+    Repetition stops at the first failure; it is only reported as an error
+    if no run succeeded.
+    """
+    run_times_ns = []
+    try:
+        for _ in range(repeat):
+            start_ns = time.perf_counter_ns()
+            row_count, _ = benchmark.execute_query(query_name, query_sql)
+            run_times_ns.append(time.perf_counter_ns() - start_ns)
+    except Exception as e:
+        if not run_times_ns:
+            return {
+                "status": "error",
+                "run_times_ns": [],
+                "row_count": None,
+                "error_message": str(e),
+            }
+    return {
+        "status": "success",
+        "run_times_ns": run_times_ns,
+        "row_count": row_count,
+        "error_message": None,
+    }
+
+
+def _worker_main(
+        requests: Connection,
+        results: Connection,
+        engine_class: type,
+        data_paths: dict[str, TableSource],
 ):
-    """Worker function to run a query in a separate process.
+    """Worker loop that keeps one engine instance alive across queries.
 
-    This allows us to forcefully terminate queries that hang or consume
-    too much memory, which SIGALRM cannot do for native code.
+    The engine is set up once, then batches of (query_name, query_sql, repeat)
+    tuples are read from ``requests`` until the shutdown sentinel arrives, and the
+    list of per-query results is sent back on ``results``. Running in a
+    separate process still allows us to forcefully terminate queries that
+    hang or consume too much memory, which SIGALRM cannot do for native code.
     """
+    if hasattr(os, "setsid"):
+        # Lead a new process group so the runner can kill any helper processes
+        # the engine starts (e.g. the JVM for Spark) together with the worker
+        os.setsid()
+
     try:
         # For Spatial Polars, ensure the package is imported first to register namespace
         if engine_class.__name__ == "SpatialPolarsBenchmark":
@@ -110,36 +194,133 @@ def _run_query_in_process(
 
         benchmark = engine_class(data_paths)
         benchmark.setup()
-        try:
-            start_time = time.perf_counter()
-            row_count, _ = benchmark.execute_query(query_name, query_sql)
-            elapsed = time.perf_counter() - start_time
-            result_queue.put({
-                "status": "success",
-                "time_seconds": round(elapsed, 2),
-                "row_count": row_count,
-                "error_message": None,
-            })
-        finally:
-            benchmark.teardown()
     except Exception as e:
-        result_queue.put({
-            "status": "error",
-            "time_seconds": None,
-            "row_count": None,
-            "error_message": str(e),
-        })
+        # Report the setup failure for every request until we are shut down
+        setup_error = str(e)
+        while (batch := requests.recv()) != SHUTDOWN:
+            results.send([{
+                "status": "error",
+                "run_times_ns": [],
+                "row_count": None,
+                "error_message": setup_error,
+            }] * len(batch))
+        return
+
+    try:
+        while (batch := requests.recv()) != SHUTDOWN:
+            results.send([_execute_query(benchmark, *request) for request in batch])
+    finally:
+        benchmark.teardown()
+
+
+class PersistentWorker:
+    """Long-lived subprocess that runs queries for a single engine.
 
+    Importing the engine libraries and creating the parquet views happens
+    once per worker instead of once per query. If a query times out or
+    crashes the worker, the process is killed and a fresh one is spawned
+    for the next query.
 
-def get_data_paths(data_dir: str) -> dict[str, str]:
+    Requests and results travel over two one-way pipes, which are plain OS
+    pipes rather than the socket pair backing a duplex Pipe. ``conn`` is
+    the end results are read from.
+    """
+
+    def __init__(self, engine_class: type, data_paths: dict[str, TableSource]):
+        self.engine_class = engine_class
+        self.data_paths = data_paths
+        self.process = None
+        self.conn = None
+        self._requests = None
+
+    def start(self) -> None:
+        request_reader, self._requests = multiprocessing.Pipe(duplex=False)
+        self.conn, result_writer = multiprocessing.Pipe(duplex=False)
+        self.process = multiprocessing.Process(
+            target=_worker_main,
+            args=(request_reader, result_writer, self.engine_class, self.data_paths),
+        )
+        self.process.start()
+        # The child owns these ends now; close ours so EOF is seen if it dies
+        request_reader.close()
+        result_writer.close()
+
+    def submit(self, batch: list[tuple[str, str | None, int]]) -> None:
+        if self.process is None:
+            self.start()
+        self._requests.send(batch)
+
+    def receive(self, timeout: float) -> list[dict[str, Any]] | None:
+        """Wait for the results of the last submission.
+
+        Returns None if the worker is still busy when the timeout expires and
+        raises WorkerCrashedError if it exited without replying.
+        """
+        ready = wait([self.conn, self.process.sentinel], timeout)
+        if not ready:
+            return None
+        # If the worker exited, give a result it sent just before exiting a moment to arrive
+        if self.conn in ready or self.conn.poll(0.5):
+            try:
+                return self.conn.recv()
+            except EOFError:
+                pass
+        self.process.join(timeout=5)
+        raise WorkerCrashedError(self.process.exitcode)
+
+    def _signal_group(self, sig: int) -> bool:
+        """Send a signal to the worker's process group; False if there is none."""
+        try:
+            os.killpg(self.process.pid, sig)
+            return True
+        except (AttributeError, ProcessLookupError, PermissionError):
+            # No process groups on this platform, or setsid() has not run yet
+            return False
+
+    def kill(self) -> None:
+        """Forcefully stop the worker process and everything it started."""
+        if self.process is None:
+            return
+        if self.process.is_alive():
+            if not self._signal_group(signal.SIGTERM):
+                self.process.terminate()
+            self.process.join(timeout=5)  # Give it 5 seconds to terminate gracefully
+
+            if self.process.is_alive():
+                # Still alive - kill it
+                if not self._signal_group(signal.SIGKILL):
+                    self.process.kill()
+                self.process.join(timeout=2)
+        # Reap helpers that outlived the worker itself
+        self._signal_group(signal.SIGKILL)
+        self.conn.close()
+        self._requests.close()
+        self.process = None
+        self.conn = None
+        self._requests = None
+
+    def shutdown(self) -> None:
+        """Ask the worker to tear down the engine and exit."""
+        if self.process is None:
+            return
+        try:
+            self._requests.send(SHUTDOWN)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=30)
+        self.kill()
+
+
+def get_data_paths(data_dir: str) -> dict[str, TableSource]:
     """Get paths to all data tables.
 
     Supports two data formats:
     1. Directory format: table_name/*.parquet (e.g., building/building.1.parquet)
     2. Single file format: table_name.parquet (e.g., building.parquet)
 
-    Returns directory paths for directories containing parquet files.
-    Both DuckDB, pandas, and SedonaDB can read all parquet files from a directory.
+    Directories are kept as-is in ``path`` (pandas and Spark read every parquet
+    file in them) and expanded to a glob in ``read_pattern`` for DuckDB and
+    SedonaDB, so engines never need to stat the filesystem in setup().
     """
     data_path = Path(data_dir)
     paths = {}
@@ -148,29 +329,48 @@ def get_data_paths(data_dir: str) -> dict[str, str]:
         table_path = data_path / table
         # Check for directory format first (from HF: building/building.1.parquet)
         if table_path.is_dir():
-            parquet_files = list(table_path.glob("*.parquet"))
-            if parquet_files:
-                # Return directory path - DuckDB, pandas, and SedonaDB all support reading
-                # all parquet files from a directory
-                paths[table] = str(table_path)
-            else:
-                paths[table] = str(table_path)
+            paths[table] = TableSource(str(table_path), True, str(table_path / "*.parquet"))
         # Then check for single file format (building.parquet)
         elif (data_path / f"{table}.parquet").exists():
-            paths[table] = str(data_path / f"{table}.parquet")
+            file_path = str(data_path / f"{table}.parquet")
+            paths[table] = TableSource(file_path, False, file_path)
         # Finally check for any matching parquet files
         else:
             matches = list(data_path.glob(f"{table}*.parquet"))
             if matches:
-                paths[table] = str(matches[0])
+                paths[table] = TableSource(str(matches[0]), False, str(matches[0]))
 
     return paths
 
 
+def prewarm_page_cache(data_paths: dict[str, TableSource]) -> int:
+    """Ask the kernel to read every parquet file into the page cache.
+
+    Workers are separate processes and open the files themselves, so the
+    OS page cache is the only thing they can share. The hint is asynchronous
+    and a no-op where posix_fadvise is unavailable (e.g. macOS).
+    Returns the number of files hinted.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return 0
+
+    count = 0
+    for source in data_paths.values():
+        files = Path(source.path).glob("*.parquet") if source.is_dir else [Path(source.path)]
+        for file in files:
+            fd = os.open(file, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                count += 1
+            finally:
+                os.close(fd)
+    return count
+
+
 class BaseBenchmark(ABC):
     """Base class for benchmark runners."""
 
-    def __init__(self, data_paths: dict[str, str], engine_name: str):
+    def __init__(self, data_paths: dict[str, TableSource], engine_name: str):
         self.data_paths = data_paths
         self.engine_name = engine_name
 
@@ -191,15 +391,15 @@ class BaseBenchmark(ABC):
 
     def run_query(self, query_name: str, query: str | None = None, timeout: int = 1200) -> BenchmarkResult:
         """Run a single query with timeout handling."""
-        start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
         try:
             with timeout_handler(timeout, query_name):
                 row_count, _ = self.execute_query(query_name, query)
-                elapsed = time.perf_counter() - start_time
+                elapsed_ns = time.perf_counter_ns() - start_ns
                 return BenchmarkResult(
                     query=query_name,
                     engine=self.engine_name,
-                    time_seconds=round(elapsed, 2),
+                    time_ns=elapsed_ns,
                     row_count=row_count,
                     status="success",
                 )
@@ -207,13 +407,13 @@ class BaseBenchmark(ABC):
             return BenchmarkResult(
                 query=query_name,
                 engine=self.engine_name,
-                time_seconds=timeout,
+                time_ns=timeout * 1_000_000_000,
                 row_count=None,
                 status="timeout",
                 error_message=str(e),
             )
         except Exception as e:
-            elapsed = time.perf_counter() - start_time
+            elapsed = (time.perf_counter_ns() - start_ns) / 1e9
             # If elapsed time is close to or exceeds timeout, treat as timeout
             # This handles cases where native code (Rust/C) throws a different exception
             # when interrupted by SIGALRM
@@ -221,7 +421,7 @@ class BaseBenchmark(ABC):
                 return BenchmarkResult(
                     query=query_name,
                     engine=self.engine_name,
-                    time_seconds=timeout,
+                    time_ns=timeout * 1_000_000_000,
                     row_count=None,
                     status="timeout",
                     error_message=f"Query timed out after {timeout}s (original error: {e})",
@@ -229,7 +429,7 @@ class BaseBenchmark(ABC):
             return BenchmarkResult(
                 query=query_name,
                 engine=self.engine_name,
-                time_seconds=None,
+                time_ns=None,
                 row_count=None,
                 status="error",
                 error_message=str(e),
@@ -239,7 +439,7 @@ class BaseBenchmark(ABC):
 class DuckDBBenchmark(BaseBenchmark):
     """DuckDB benchmark runner."""
 
-    def __init__(self, data_paths: dict[str, str]):
+    def __init__(self, data_paths: dict[str, TableSource]):
         super().__init__(data_paths, "duckdb")
         self._conn = None
 
@@ -248,12 +448,8 @@ class DuckDBBenchmark(BaseBenchmark):
         self._conn = duckdb.connect()
         self._conn.execute("LOAD spatial;")
         self._conn.execute("SET enable_external_file_cache = false;")
-        for table, path in self.data_paths.items():
-            # DuckDB needs glob pattern for directories, add /*.parquet if path is a directory
-            parquet_path = path
-            if Path(path).is_dir():
-                parquet_path = str(Path(path) / "*.parquet")
-            self._conn.execute(f"CREATE VIEW {table} AS SELECT * FROM read_parquet('{parquet_path}')")
+        for table, source in self.data_paths.items():
+            self._conn.execute(f"CREATE VIEW {table} AS SELECT * FROM read_parquet('{source.read_pattern}')")
 
     def teardown(self) -> None:
         if self._conn:
@@ -268,44 +464,40 @@ class DuckDBBenchmark(BaseBenchmark):
 class GeoPandasBenchmark(BaseBenchmark):
     """GeoPandas benchmark runner."""
 
-    def __init__(self, data_paths: dict[str, str]):
+    def __init__(self, data_paths: dict[str, TableSource]):
         super().__init__(data_paths, "geopandas")
         self._queries = None
+        self._table_paths = None
 
     def setup(self) -> None:
-        import importlib.util
-        geopandas_path = Path(__file__).parent.parent / "spatialbench-queries" / "geopandas_queries.py"
-        spec = importlib.util.spec_from_file_location("geopandas_queries", geopandas_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        self._queries = {f"q{i}": getattr(module, f"q{i}") for i in range(1, QUERY_COUNT + 1)}
+        # spatialbench-queries is on sys.path, so a plain import is compiled once per process
+        import geopandas_queries as module
+        self._queries = module.QUERIES
+        self._table_paths = {table: source.path for table, source in self.data_paths.items()}
 
     def teardown(self) -> None:
         self._queries = None
+        self._table_paths = None
 
     def execute_query(self, query_name: str, query: str | None) -> tuple[int, Any]:
         if query_name not in self._queries:
             raise ValueError(f"Query {query_name} not found")
-        result = self._queries[query_name](self.data_paths)
+        result = self._queries[query_name](self._table_paths)
         return len(result), result
 
 
 class SedonaDBBenchmark(BaseBenchmark):
     """SedonaDB benchmark runner."""
 
-    def __init__(self, data_paths: dict[str, str]):
+    def __init__(self, data_paths: dict[str, TableSource]):
         super().__init__(data_paths, "sedonadb")
         self._sedona = None
 
     def setup(self) -> None:
         import sedonadb
         self._sedona = sedonadb.connect()
-        for table, path in self.data_paths.items():
-            # SedonaDB needs glob pattern for directories
-            parquet_path = path
-            if Path(path).is_dir():
-                parquet_path = str(Path(path) / "*.parquet")
-            self._sedona.read_parquet(parquet_path).to_view(table, overwrite=True)
+        for table, source in self.data_paths.items():
+            self._sedona.read_parquet(source.read_pattern).to_view(table, overwrite=True)
 
     def teardown(self) -> None:
         self._sedona = None
@@ -318,36 +510,43 @@ class SedonaDBBenchmark(BaseBenchmark):
 class SpatialPolarsBenchmark(BaseBenchmark):
     """Spatial Polars benchmark runner."""
 
-    def __init__(self, data_paths: dict[str, str]):
+    def __init__(self, data_paths: dict[str, TableSource]):
         super().__init__(data_paths, "spatial_polars")
         self._queries = None
+        self._table_paths = None
 
     def setup(self) -> None:
-        # spatial_polars package is already imported in _run_query_in_process
+        # spatial_polars package is already imported in _worker_main
         # to register .spatial namespace before any module loading
 
-        # Load query functions directly from the module
-        import importlib.util
-        query_file = Path(__file__).parent.parent / "spatialbench-queries" / "spatial_polars.py"
-        spec = importlib.util.spec_from_file_location("spatial_polars_queries", query_file)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        self._queries = {f"q{i}": getattr(module, f"q{i}") for i in range(1, QUERY_COUNT + 1)}
+        # The query file shares its name with the installed spatial_polars package, so it
+        # has to be loaded by path; register it in sys.modules so that happens only once
+        module = sys.modules.get("spatial_polars_queries")
+        if module is None:
+            import importlib.util
+            query_file = Path(__file__).parent.parent / "spatialbench-queries" / "spatial_polars.py"
+            spec = importlib.util.spec_from_file_location("spatial_polars_queries", query_file)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules["spatial_polars_queries"] = module
+            spec.loader.exec_module(module)
+        self._queries = module.QUERIES
+        self._table_paths = {table: source.path for table, source in self.data_paths.items()}
 
     def teardown(self) -> None:
         self._queries = None
+        self._table_paths = None
 
     def execute_query(self, query_name: str, query: str | None) -> tuple[int, Any]:
         if query_name not in self._queries:
             raise ValueError(f"Query {query_name} not found")
-        result = self._queries[query_name](self.data_paths)
+        result = self._queries[query_name](self._table_paths)
         return len(result), result
 
 
 class SedonaSparkBenchmark(BaseBenchmark):
     """Apache Sedona (Spark) benchmark runner."""
 
-    def __init__(self, data_paths: dict[str, str]):
+    def __init__(self, data_paths: dict[str, TableSource]):
         super().__init__(data_paths, "apache_sedona")
         self._spark = None
 
@@ -407,8 +606,8 @@ class SedonaSparkBenchmark(BaseBenchmark):
         self._spark = SedonaContext.create(session)
 
         # 5. Load Tables
-        for table, path in self.data_paths.items():
-            df = self._spark.read.parquet(path)
+        for table, source in self.data_paths.items():
+            df = self._spark.read.parquet(source.path)
             df.createOrReplaceTempView(table)
 
     def teardown(self) -> None:
@@ -428,7 +627,7 @@ class SedonaSparkBenchmark(BaseBenchmark):
 class PgStromBenchmark(BaseBenchmark):
     """PG-Strom (GPU Accelerated PostgreSQL) benchmark runner."""
 
-    def __init__(self, data_paths: dict[str, str]):
+    def __init__(self, data_paths: dict[str, TableSource]):
         super().__init__(data_paths, "pgstrom")
         self._conn = None
         self.skip_load = True
@@ -501,12 +700,12 @@ class PgStromBenchmark(BaseBenchmark):
             self._conn.execute(f"DROP FOREIGN TABLE IF EXISTS {table_name}_staging CASCADE;")
 
         # 3. PROCESS TABLES
-        for table_name, raw_path in self.data_paths.items():
-            abs_path = os.path.abspath(raw_path)
+        for table_name, source in self.data_paths.items():
+            abs_path = os.path.abspath(source.path)
 
             # --- FILE DISCOVERY ---
             parquet_files = []
-            if os.path.isdir(abs_path):
+            if source.is_dir:
                 merged_file = os.path.join(abs_path, f"{table_name}.merged.parquet")
                 if os.path.exists(merged_file):
                     print(f"--- Processing {table_name} (Using Merged File) ---")
@@ -641,107 +840,202 @@ class PgStromBenchmark(BaseBenchmark):
         return len(res), res
 
 
-def get_sql_queries(dialect: str) -> dict[str, str]:
-    """Get SQL queries for a specific dialect from print_queries.py."""
-    from print_queries import (
-        DuckDBSpatialBenchBenchmark,
-        SedonaDBSpatialBenchBenchmark,
-        SpatialBenchBenchmark,
-        PgStromSpatialBenchBenchmark
-    )
+@lru_cache(maxsize=None)
+def get_sql_queries(dialect: str) -> tuple[tuple[str, str], ...]:
+    """Get (query_name, sql) pairs for a specific dialect from print_queries.py."""
+    from print_queries import SpatialBenchBenchmark
     dialects = {
-        "duckdb": DuckDBSpatialBenchBenchmark,
-        "sedonadb": SedonaDBSpatialBenchBenchmark,
-        "SedonaSpark": SpatialBenchBenchmark,
-        "PgStrom": PgStromSpatialBenchBenchmark
+        "duckdb": "DuckDB",
+        "sedonadb": "SedonaDB",
+        "SedonaSpark": "SedonaSpark",
+        "PgStrom": "PgStrom"
     }
-    return dialects[dialect]().queries()
+    return tuple(SpatialBenchBenchmark(dialects[dialect]).queries().items())
+
+
+# Python-based engines look queries up by name and have no SQL text
+PYTHON_QUERIES = tuple((q, None) for q in QUERY_ORDER)
+
+
+def _to_result(engine_name: str, query_name: str, result_data: dict[str, Any], timeout: int) -> BenchmarkResult:
+    """Build a BenchmarkResult from a worker reply, averaging its runs."""
+    run_times = result_data["run_times_ns"]
+    # Repetitions share one hard timeout, so the per-run limit is enforced here
+    timeout_ns = timeout * 1_000_000_000
+    if run_times and run_times[0] > timeout_ns:
+        return BenchmarkResult(
+            query=query_name,
+            engine=engine_name,
+            time_ns=timeout_ns,
+            row_count=None,
+            status="timeout",
+            error_message=f"Query {query_name} timed out after {timeout} seconds",
+        )
+    run_times = list(takewhile(lambda t: t <= timeout_ns, run_times))
+    return BenchmarkResult(
+        query=query_name,
+        engine=engine_name,
+        time_ns=sum(run_times) // len(run_times) if run_times else None,
+        row_count=result_data["row_count"],
+        status=result_data["status"],
+        error_message=result_data["error_message"],
+        runs=len(run_times),
+    )
 
 
 def run_query_isolated(
-        engine_class: type,
+        worker: PersistentWorker,
         engine_name: str,
-        data_paths: dict[str, str],
         query_name: str,
         query_sql: str | None,
         timeout: int,
+        repeat: int = 1,
 ) -> BenchmarkResult:
-    """Run a single query in an isolated subprocess with hard timeout.
+    """Run a single query on a persistent worker subprocess with hard timeout.
 
     This is more robust than SIGALRM because:
     1. Native code (C++/Rust) can be forcefully terminated
     2. Memory-hungry queries don't affect the main process
     3. Crashed queries don't invalidate the benchmark runner
-    """
-    result_queue = multiprocessing.Queue()
-    process = multiprocessing.Process(
-        target=_run_query_in_process,
-        args=(result_queue, engine_class, data_paths, query_name, query_sql),
-    )
 
-    process.start()
-    process.join(timeout=timeout)
-
-    if process.is_alive():
-        # Query exceeded timeout - forcefully terminate
-        process.terminate()
-        process.join(timeout=5)  # Give it 5 seconds to terminate gracefully
-
-        if process.is_alive():
-            # Still alive - kill it
-            process.kill()
-            process.join(timeout=2)
+    On timeout or crash the worker is killed; it is respawned lazily by the
+    next submission. With ``repeat`` > 1 all runs are done in one request,
+    and if that request fails the runs are retried one request each so the
+    successful ones still count.
+    """
+    worker.submit([(query_name, query_sql, repeat)])
 
+    try:
+        results = worker.receive(timeout * repeat)
+    except WorkerCrashedError as e:
+        # Worker died without sending a result
+        worker.kill()
+        if repeat > 1:
+            return _run_query_repeatedly(worker, engine_name, query_name, query_sql, timeout, repeat)
         return BenchmarkResult(
             query=query_name,
             engine=engine_name,
-            time_seconds=timeout,
+            time_ns=None,
             row_count=None,
-            status="timeout",
-            error_message=f"Query {query_name} timed out after {timeout} seconds (process killed)",
+            status="error",
+            error_message=f"Query {query_name} crashed ({e})",
         )
 
-    # Process completed - get result from queue
-    try:
-        result_data = result_queue.get_nowait()
-        return BenchmarkResult(
-            query=query_name,
-            engine=engine_name,
-            time_seconds=result_data["time_seconds"],
-            row_count=result_data["row_count"],
-            status=result_data["status"],
-            error_message=result_data["error_message"],
-        )
-    except Exception:
-        # Process died without putting result in queue
+    if results is None:
+        # Query exceeded timeout - forcefully terminate
+        worker.kill()
+        if repeat > 1:
+            return _run_query_repeatedly(worker, engine_name, query_name, query_sql, timeout, repeat)
         return BenchmarkResult(
             query=query_name,
             engine=engine_name,
-            time_seconds=None,
+            time_ns=timeout * 1_000_000_000,
             row_count=None,
-            status="error",
-            error_message=f"Query {query_name} crashed (process exit code: {process.exitcode})",
+            status="timeout",
+            error_message=f"Query {query_name} timed out after {timeout} seconds (process killed)",
         )
 
+    [result_data] = results
+    return _to_result(engine_name, query_name, result_data, timeout)
+
+
+def _run_query_repeatedly(
+        worker: PersistentWorker,
+        engine_name: str,
+        query_name: str,
+        query_sql: str | None,
+        timeout: int,
+        runs: int,
+) -> BenchmarkResult:
+    """Run a query ``runs`` times with one worker request per run.
+
+    Stops at the first failed run after a success and averages the
+    successful runs.
+    """
+    result = run_query_isolated(worker, engine_name, query_name, query_sql, timeout)
+    if result.status != "success":
+        return result
+
+    run_times = [result.time_ns]
+    for _ in range(1, runs):
+        additional_result = run_query_isolated(worker, engine_name, query_name, query_sql, timeout)
+        if additional_result.status != "success":
+            break
+        run_times.append(additional_result.time_ns)
+
+    return BenchmarkResult(
+        query=query_name,
+        engine=engine_name,
+        time_ns=sum(run_times) // len(run_times),
+        row_count=result.row_count,
+        status="success",
+        runs=len(run_times),
+    )
+
+
+def run_query_batch(
+        worker: PersistentWorker,
+        engine_name: str,
+        batch: list[tuple[str, str | None]],
+        timeout: int,
+        repeat: int = 1,
+) -> list[BenchmarkResult]:
+    """Run several queries, each ``repeat`` times, with a single request to the worker.
+
+    The hard timeout scales with the number of queries and runs. If the
+    batch times out or crashes the worker, the worker is replaced and every
+    query in the batch is rerun on its own, so the failure is attributed to
+    the query that caused it.
+    """
+    if len(batch) == 1:
+        query_name, query_sql = batch[0]
+        return [run_query_isolated(worker, engine_name, query_name, query_sql, timeout, repeat)]
+
+    worker.submit([(query_name, query_sql, repeat) for query_name, query_sql in batch])
+    try:
+        results = worker.receive(timeout * repeat * len(batch))
+    except WorkerCrashedError:
+        results = None
+
+    if results is not None:
+        return [
+            _to_result(engine_name, query_name, result_data, timeout)
+            for (query_name, _), result_data in zip(batch, results)
+        ]
+
+    worker.kill()
+    return [
+        run_query_isolated(worker, engine_name, query_name, query_sql, timeout, repeat)
+        for query_name, query_sql in batch
+    ]
+
 
 def run_benchmark(
         engine: str,
-        data_paths: dict[str, str],
+        data_paths: dict[str, TableSource],
         queries: list[str] | None,
         timeout: int,
         scale_factor: float,
         runs: int = 3,
+        out: TextIO | None = None,
+        batch_size: int = 1,
+        on_result: Callable[[BenchmarkResult], None] | None = None,
 ) -> BenchmarkSuite:
     """Generic benchmark runner for any engine.
 
-    Each query runs in an isolated subprocess to ensure:
+    Queries run in a persistent worker subprocess to ensure:
     - Hard timeout enforcement (process can be killed)
     - Memory isolation (one query can't OOM the runner)
-    - Crash isolation (one query crash doesn't affect others)
+    - Crash isolation (a crashed worker is replaced for the next query)
+
+    If runs > 1, every run of a query is done in the same worker request and
+    the average time of the successful runs is reported for fair comparison.
+    With batch_size > 1 consecutive queries are sent to the worker together.
 
-    If runs > 1 and the first run succeeds, additional runs are performed
-    and the average time is reported for fair comparison.
+    Progress is written to ``out`` (stdout by default) so that engines running
+    concurrently can buffer their output and print it once they finish.
     """
+    out = out or sys.stdout
 
     from importlib.metadata import version as pkg_version
 
@@ -755,7 +1049,7 @@ def run_benchmark(
         "geopandas": {
             "class": GeoPandasBenchmark,
             "version_getter": lambda: pkg_version("geopandas"),
-            "queries_getter": lambda: {f"q{i}": None for i in range(1, QUERY_COUNT + 1)},
+            "queries_getter": lambda: PYTHON_QUERIES,
         },
         "sedonadb": {
             "class": SedonaDBBenchmark,
@@ -765,7 +1059,7 @@ def run_benchmark(
         "spatial_polars": {
             "class": SpatialPolarsBenchmark,
             "version_getter": lambda: pkg_version("spatial-polars"),
-            "queries_getter": lambda: {f"q{i}": None for i in range(1, QUERY_COUNT + 1)},
+            "queries_getter": lambda: PYTHON_QUERIES,
         },
         "apache_sedona": {
             "class": SedonaSparkBenchmark,
@@ -786,71 +1080,49 @@ def run_benchmark(
     # Format engine name for display
     display_name = engine.replace("_", " ").title()
 
-    print(f"\n{'=' * 60}")
-    print(f"Running {display_name} Benchmark")
-    print(f"{'=' * 60}")
-    print(f"{display_name} version: {version}")
+    print(f"\n{'=' * 60}", file=out)
+    print(f"Running {display_name} Benchmark", file=out)
+    print(f"{'=' * 60}", file=out)
+    print(f"{display_name} version: {version}", file=out)
     if runs > 1:
-        print(f"Runs per query: {runs} (average will be reported)")
+        print(f"Runs per query: {runs} (average will be reported)", file=out)
 
     suite = BenchmarkSuite(engine=engine, scale_factor=scale_factor, version=version)
     all_queries = config["queries_getter"]()
-    engine_class = config["class"]
-
-    for query_name, query_sql in all_queries.items():
-        if queries and query_name not in queries:
-            continue
-
-        print(f"  Running {query_name}...", end=" ", flush=True)
-
-        # First run
-        result = run_query_isolated(
-            engine_class=engine_class,
-            engine_name=engine,
-            data_paths=data_paths,
-            query_name=query_name,
-            query_sql=query_sql,
-            timeout=timeout,
-        )
+    worker = PersistentWorker(config["class"], data_paths)
 
-        # If first run succeeded and we want multiple runs, do additional runs
-        if result.status == "success" and runs > 1:
-            run_times = [result.time_seconds]
-
-            for run_num in range(2, runs + 1):
-                additional_result = run_query_isolated(
-                    engine_class=engine_class,
-                    engine_name=engine,
-                    data_paths=data_paths,
-                    query_name=query_name,
-                    query_sql=query_sql,
-                    timeout=timeout,
-                )
-                if additional_result.status == "success":
-                    run_times.append(additional_result.time_seconds)
-                else:
-                    # If any subsequent run fails, just use successful runs
-                    break
+    selected = [(name, sql) for name, sql in all_queries if not queries or name in queries]
 
-            # Calculate average of all successful runs
-            avg_time = round(sum(run_times) / len(run_times), 2)
-            result = BenchmarkResult(
-                query=query_name,
-                engine=engine,
-                time_seconds=avg_time,
-                row_count=result.row_count,
-                status="success",
-                error_message=None,
+    try:
+        for start in range(0, len(selected), batch_size):
+            batch = selected[start:start + batch_size]
+            if len(batch) > 1:
+                print(f"  Running {', '.join(name for name, _ in batch)} (batched)...", file=out, flush=True)
+
+            results = run_query_batch(
+                worker=worker,
+                engine_name=engine,
+                batch=batch,
+                timeout=timeout,
+                repeat=runs,
             )
-            print(f"{avg_time}s avg ({len(run_times)} runs, {result.row_count} rows)")
-        elif result.status == "success":
-            print(f"{result.time_seconds}s ({result.row_count} rows)")
-        else:
-            print(f"{result.status.upper()}: {result.error_message}")
 
-        suite.results.append(result)
-        if result.status == "success":
-            suite.total_time += result.time_seconds
+            for (query_name, _), result in zip(batch, results):
+                print(f"  Running {query_name}...", end=" ", file=out, flush=True)
+                if result.status == "success" and runs > 1:
+                    print(f"{result.time_seconds:.2f}s avg ({result.runs} runs, {result.row_count} rows)", file=out)
+                elif result.status == "success":
+                    print(f"{result.time_seconds:.2f}s ({result.row_count} rows)", file=out)
+                else:
+                    print(f"{result.status.upper()}: {result.error_message}", file=out)
+
+                suite.results.append(result)
+                if on_result is not None:
+                    on_result(result)
+                if result.status == "success":
+                    suite.total_time += result.time_seconds
+    finally:
+        worker.shutdown()
 
     return suite
 
@@ -861,45 +1133,101 @@ def print_summary(results: list[BenchmarkSuite]) -> None:
     print("BENCHMARK SUMMARY")
     print("=" * 80)
 
-    all_queries = sorted(
-        {r.query for suite in results for r in suite.results},
-        key=lambda x: int(x[1:])
-    )
+    seen = {r.query for suite in results for r in suite.results}
+    all_queries = [q for q in QUERY_ORDER if q in seen]
+    all_queries += sorted(seen.difference(QUERY_ORDER))
 
-    data = {
-        suite.engine: {
-            r.query: f"{r.time_seconds:.2f}s" if r.status == "success" else r.status.upper()
-            for r in suite.results
-        }
+    cells = {
+        (suite.engine, r.query): f"{r.time_seconds:.2f}s" if r.status == "success" else r.status.upper()
         for suite in results
+        for r in suite.results
     }
-
     engines = [s.engine for s in results]
+    rows = [[query] + [cells.get((e, query), "N/A") for e in engines] for query in all_queries]
+
     header = f"{'Query':<10}" + "".join(f"{e:<15}" for e in engines)
     print(header)
     print("-" * len(header))
 
-    for query in all_queries:
-        row = f"{query:<10}" + "".join(f"{data.get(e, {}).get(query, 'N/A'):<15}" for e in engines)
-        print(row)
+    for query, *row in rows:
+        print(f"{query:<10}" + "".join(f"{cell:<15}" for cell in row))
 
     print("-" * len(header))
     print(f"{'Total':<10}" + "".join(f"{s.total_time:.2f}s{'':<9}" for s in results))
 
 
-def save_results(results: list[BenchmarkSuite], output_file: str) -> None:
-    """Save results to JSON file."""
-    output = {
-        "benchmark": "spatialbench",
-        "version": "0.1.0",
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-        "results": [suite.to_dict() for suite in results],
-    }
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Encode obj as JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(obj, indent=2 if pretty else None).encode()
 
-    with open(output_file, "w") as f:
-        json.dump(output, f, indent=2)
 
-    print(f"\nResults saved to {output_file}")
+class ResultsWriter:
+    """Write benchmark suites to the results JSON file as they complete.
+
+    The envelope is written up front and each suite is appended as soon as
+    it is available, so suites that finished before a crash are already on
+    disk and no list of per-suite dicts is built in memory.
+
+    Individual query results are also appended to a ``.partial.jsonl``
+    sidecar (started afresh by each run) as they arrive, which survives the runner itself being killed
+    mid-suite. The sidecar is removed once the results file is complete.
+    """
+
+    def __init__(self, output_file: str, pretty: bool = False):
+        self.output_file = output_file
+        self.partial_file = f"{output_file}.partial.jsonl"
+        self.pretty = pretty
+        self._file = None
+        self._partial = None
+        self._partial_lock = threading.Lock()
+        self._count = 0
+
+    def __enter__(self) -> "ResultsWriter":
+        # Truncate rather than append, so results left behind by a crashed
+        # earlier run are not mixed into this one
+        self._partial = open(self.partial_file, "wb")
+        self._file = open(self.output_file, "wb")
+        header = _dumps({
+            "benchmark": "spatialbench",
+            "version": "0.1.0",
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+        }, self.pretty)
+        if self.pretty:
+            self._file.write(header[:-2] + b',\n  "results": [')
+        else:
+            self._file.write(header[:-1] + b',"results":[')
+        self._file.flush()
+        return self
+
+    def append(self, suite: BenchmarkSuite) -> None:
+        encoded = _dumps(suite.to_dict(), self.pretty)
+        if self.pretty:
+            encoded = b"\n    " + encoded.replace(b"\n", b"\n    ")
+        self._file.write((b"," if self._count else b"") + encoded)
+        self._file.flush()
+        self._count += 1
+
+    def record(self, engine: str, result: BenchmarkResult) -> None:
+        """Durably append a single query result to the sidecar file."""
+        line = _dumps({"engine": engine, "result": result.to_dict()}) + b"\n"
+        # Engines may run in parallel threads
+        with self._partial_lock:
+            self._partial.write(line)
+            self._partial.flush()
+            os.fsync(self._partial.fileno())
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self.pretty:
+            self._file.write(b"\n  ]\n}" if self._count else b"]\n}")
+        else:
+            self._file.write(b"]}")
+        self._file.close()
+        self._partial.close()
+        if exc_type is None:
+            os.remove(self.partial_file)
+        print(f"\nResults saved to {self.output_file}")
 
 
 def main():
@@ -920,6 +1248,15 @@ def main():
                         help="Output file for results")
     parser.add_argument("--scale-factor", type=float, default=1,
                         help="Scale factor of the data (for reporting only)")
+    parser.add_argument("--batch-size", type=int, default=1,
+                        help="Number of queries sent to the engine worker per request (default: 1)")
+    parser.add_argument("--no-prewarm", action="store_true",
+                        help="Do not pre-load the parquet files into the OS page cache before benchmarking")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Indent the results JSON for human readers")
+    parser.add_argument("--parallel-engines", action="store_true",
+                        help="Benchmark all engines concurrently. Engines compete for CPU and memory, "
+                             "so avoid this on memory-constrained hosts or when timings must be comparable")
 
     args = parser.parse_args()
 
@@ -931,6 +1268,10 @@ def main():
             print(f"Error: Unknown engine '{e}'. Valid options: {valid_engines}")
             sys.exit(1)
 
+    if args.batch_size < 1:
+        print(f"Error: --batch-size must be at least 1, got {args.batch_size}")
+        sys.exit(1)
+
     queries = [q.strip().lower() for q in args.queries.split(",")] if args.queries else None
 
     data_paths = get_data_paths(args.data_dir)
@@ -939,16 +1280,40 @@ def main():
         sys.exit(1)
 
     print("Data paths:")
-    for table, path in data_paths.items():
-        print(f"  {table}: {path}")
-
-    results = [
-        run_benchmark(engine, data_paths, queries, args.timeout, args.scale_factor, args.runs)
-        for engine in engines
-    ]
+    for table, source in data_paths.items():
+        print(f"  {table}: {source.path}")
+
+    if not args.no_prewarm:
+        prewarmed = prewarm_page_cache(data_paths)
+        if prewarmed:
+            print(f"Pre-loading {prewarmed} parquet files into the page cache")
+
+    results = []
+    with ResultsWriter(args.output, pretty=args.pretty) as writer:
+        if args.parallel_engines and len(engines) > 1:
+            # Each engine runs in its own worker subprocess, so threads are enough to drive them.
+            # Output is buffered per engine and printed in submission order to keep logs readable.
+            with ThreadPoolExecutor(max_workers=len(engines)) as executor:
+                buffers = [io.StringIO() for _ in engines]
+                futures = [
+                    executor.submit(run_benchmark, engine, data_paths, queries, args.timeout,
+                                    args.scale_factor, args.runs, buffer, args.batch_size,
+                                    partial(writer.record, engine))
+                    for engine, buffer in zip(engines, buffers)
+                ]
+                for future, buffer in zip(futures, buffers):
+                    suite = future.result()
+                    print(buffer.getvalue(), end="")
+                    writer.append(suite)
+                    results.append(suite)
+        else:
+            for engine in engines:
+                suite = run_benchmark(engine, data_paths, queries, args.timeout, args.scale_factor, args.runs,
+                                      batch_size=args.batch_size, on_result=partial(writer.record, engine))
+                writer.append(suite)
+                results.append(suite)
 
-    print_summary(results)
-    save_results(results, args.output)
+        print_summary(results)
 
 
 if __name__ == "__main__":
@@ -22,25 +22,91 @@ Summarize benchmark results from multiple engines into a markdown report.
 
 import argparse
 import json
+import os
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; large files are then parsed in one go
+    ijson = None
+
+# Results files larger than this are streamed with ijson when it is installed
+STREAM_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+# Engine display names with icons
+ENGINE_ICONS = {
+    "sedonadb": "🌵 SedonaDB",
+    "duckdb": "🦆 DuckDB",
+    "geopandas": "🐼 GeoPandas",
+    "spatial_polars": "🐻‍❄️ Spatial Polars",
+}
+
+STATUS_EMOJI = {
+    "success": "✅",
+    "error": "❌",
+    "timeout": "⏱️",
+}
+
+
+@lru_cache(maxsize=64)
+def _parse_results_file(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a results file; the stat fields key the cache so edited files are reparsed."""
+    if ijson is not None and size > STREAM_THRESHOLD_BYTES:
+        # Only the suites are used, so skip building the rest of the document
+        with open(path, "rb") as f:
+            return {"results": list(ijson.items(f, "results.item", use_float=True))}
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _load_results_file(entry: os.DirEntry) -> dict:
+    stat = entry.stat()
+    return _parse_results_file(entry.path, stat.st_mtime_ns, stat.st_size)
+
 
 def load_results(results_dir: str) -> dict:
-    """Load all JSON result files from a directory."""
-    results = {}
-    results_path = Path(results_dir)
+    """Load all JSON result files from a directory.
 
-    for json_file in results_path.glob("*_results.json"):
-        with open(json_file) as f:
-            data = json.load(f)
-            for suite in data.get("results", []):
-                engine = suite["engine"]
-                results[engine] = suite
+    Files are parsed on a thread pool when there are more than two of them.
+    """
+    results = {}
+    # A missing directory just means no engine produced results
+    if not os.path.isdir(results_dir):
+        return results
+    with os.scandir(results_dir) as entries:
+        json_files = [e for e in entries if e.name.endswith("_results.json") and e.is_file()]
+
+    if len(json_files) > 2:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            parsed = list(executor.map(_load_results_file, json_files))
+    else:
+        parsed = [_load_results_file(json_file) for json_file in json_files]
+
+    for data in parsed:
+        for suite in data.get("results", []):
+            engine = suite["engine"]
+            results[engine] = suite
 
     return results
 
 
+def query_sort_key(query: str) -> tuple[int, int | str]:
+    """Sort q1..qN numerically, followed by any other query names."""
+    number = query[1:]
+    return (0, int(number)) if number.isdigit() else (1, query)
+
+
+@lru_cache(maxsize=2048)
 def format_time(seconds: float | None) -> str:
     """Format time in seconds to a readable string."""
     if seconds is None:
@@ -50,60 +116,55 @@ def format_time(seconds: float | None) -> str:
     return f"{seconds:.2f}s"
 
 
-def get_winner(query: str, data: dict, engines: list) -> str | None:
-    """Get the fastest engine for a query."""
-    times = {}
-    for engine in engines:
-        result = data.get(engine, {}).get(query, {})
-        if result.get("status") == "success" and result.get("time_seconds") is not None:
-            times[engine] = result["time_seconds"]
-
-    if not times:
+def get_winner(times: list[float | None], engines: list) -> str | None:
+    """Get the fastest engine for a query from its successful times, aligned with engines."""
+    candidates = [(t, i) for i, t in enumerate(times) if t is not None]
+    if not candidates:
         return None
-    return min(times, key=times.get)
+    return engines[min(candidates)[1]]
 
 
-def generate_markdown_summary(results: dict, output_file: str, query_timeout: int | None = None, runs: int | None = None) -> str:
-    """Generate a markdown summary of benchmark results for GitHub Actions."""
+def _markdown_lines(results: dict, query_timeout: int | None, runs: int | None) -> Iterator[str]:
+    """Yield the lines of the markdown summary."""
     engines = sorted(results.keys())
 
     if not engines:
-        markdown = "# 📊 SpatialBench Benchmark Results\n\n⚠️ No results found."
-        with open(output_file, "w") as f:
-            f.write(markdown)
-        return markdown
+        yield from ["# 📊 SpatialBench Benchmark Results", "", "⚠️ No results found."]
+        return
 
     # Get scale factor from first result
     scale_factor = results[engines[0]].get("scale_factor", 1)
     timestamp = results[engines[0]].get("timestamp", datetime.now(timezone.utc).isoformat())
 
-    # Collect all queries
-    all_queries = set()
-    for engine_data in results.values():
-        for r in engine_data.get("results", []):
-            all_queries.add(r["query"])
-    all_queries = sorted(all_queries, key=lambda x: int(x[1:]))
-
     # Build result lookup
-    data = {}
-    for engine, engine_data in results.items():
-        data[engine] = {}
-        for r in engine_data.get("results", []):
-            data[engine][r["query"]] = r
+    data = {
+        engine: {r["query"]: r for r in engine_data.get("results", [])}
+        for engine, engine_data in results.items()
+    }
+    all_queries = sorted({query for engine_data in data.values() for query in engine_data}, key=query_sort_key)
+
+    # Format every (engine, query) cell once for the comparison and detailed tables
+    formatted = {
+        (engine, query): (format_time(result.get("time_seconds")), result.get("status", "N/A"), result.get("row_count"))
+        for engine in engines
+        for query in all_queries
+        for result in [data.get(engine, {}).get(query, {})]
+    }
+
+    # Successful run times, one list per engine aligned with all_queries
+    times = {
+        engine: [
+            result.get("time_seconds") if (result := data[engine].get(query, {})).get("status") == "success" else None
+            for query in all_queries
+        ]
+        for engine in engines
+    }
 
     # Get version info
     versions = {engine: results[engine].get("version", "unknown") for engine in engines}
 
-    # Engine display names with icons
-    engine_icons = {
-        "sedonadb": "🌵 SedonaDB",
-        "duckdb": "🦆 DuckDB",
-        "geopandas": "🐼 GeoPandas",
-        "spatial_polars": "🐻‍❄️ Spatial Polars",
-    }
-
     # Generate markdown
-    lines = [
+    yield from [
         "# 📊 SpatialBench Benchmark Results",
         "",
         "| Parameter | Value |",
@@ -121,126 +182,113 @@ def generate_markdown_summary(results: dict, output_file: str, query_timeout: in
     ]
 
     for engine in engines:
-        icon_name = engine_icons.get(engine, engine.title())
-        lines.append(f"| {icon_name} | `{versions[engine]}` |")
+        icon_name = ENGINE_ICONS.get(engine, engine.title())
+        yield f"| {icon_name} | `{versions[engine]}` |"
 
     # Main results table
-    lines.extend([
+    yield from [
         "",
         "## 🏁 Results Comparison",
         "",
-        "| Query | " + " | ".join(engine_icons.get(e, e.title()) for e in engines) + " |",
+        "| Query | " + " | ".join(ENGINE_ICONS.get(e, e.title()) for e in engines) + " |",
         "|:------|" + "|".join(":---:" for _ in engines) + "|",
-    ])
+    ]
+
+    # The column count is fixed once the engines are known
+    row_fmt = "| **{}** | " + " | ".join("{}" for _ in engines) + " |"
 
-    # Add rows for each query with winner highlighting
-    for query in all_queries:
-        winner = get_winner(query, data, engines)
-        row = f"| **{query.upper()}** |"
+    # Add rows for each query with winner highlighting, counting wins as we go
+    win_counts = Counter()
+    for i, query in enumerate(all_queries):
+        winner = get_winner([times[engine][i] for engine in engines], engines)
+        if winner:
+            win_counts[winner] += 1
+        cells = []
         for engine in engines:
-            result = data.get(engine, {}).get(query, {})
-            status = result.get("status", "N/A")
+            time_str, status, _ = formatted[engine, query]
             if status == "success":
-                time_val = result.get("time_seconds")
-                time_str = format_time(time_val)
                 if engine == winner:
-                    row += f" **{time_str}** |"
+                    cells.append(f"**{time_str}**")
                 else:
-                    row += f" {time_str} |"
+                    cells.append(time_str)
             elif status == "timeout":
-                row += " ⏱️ TIMEOUT |"
+                cells.append("⏱️ TIMEOUT")
             elif status == "error":
-                row += " ❌ ERROR |"
+                cells.append("❌ ERROR")
             else:
-                row += " — |"
-        lines.append(row)
+                cells.append("—")
+        yield row_fmt.format(query.upper(), *cells)
 
     # Win count summary
-    win_counts = {engine: 0 for engine in engines}
-    for query in all_queries:
-        winner = get_winner(query, data, engines)
-        if winner:
-            win_counts[winner] += 1
-
-    lines.extend([
+    yield from [
         "",
         "## 🥇 Performance Summary",
         "",
         "| Engine | Wins |",
         "|--------|:----:|",
-    ])
+    ]
 
     for engine in sorted(engines, key=lambda e: win_counts[e], reverse=True):
-        icon_name = engine_icons.get(engine, engine.title())
+        icon_name = ENGINE_ICONS.get(engine, engine.title())
         wins = win_counts[engine]
-        lines.append(f"| {icon_name} | {wins} |")
+        yield f"| {icon_name} | {wins} |"
 
     # Detailed results section (collapsible)
-    lines.extend([
+    yield from [
         "",
         "## 📋 Detailed Results",
         "",
-    ])
+    ]
+
+    # Errors and timeouts are collected while emitting the detailed tables
+    errors = {}
 
     for engine in engines:
-        icon_name = engine_icons.get(engine, engine.title())
-        lines.extend([
+        icon_name = ENGINE_ICONS.get(engine, engine.title())
+        engine_errors = []
+        yield from [
             f"<details>",
             f"<summary><b>{icon_name}</b> - Click to expand</summary>",
             "",
             "| Query | Time | Status | Rows |",
             "|:------|-----:|:------:|-----:|",
-        ])
+        ]
 
         for query in all_queries:
-            result = data.get(engine, {}).get(query, {})
-            time_str = format_time(result.get("time_seconds"))
-            status = result.get("status", "N/A")
-            rows = result.get("row_count")
+            time_str, status, rows = formatted[engine, query]
             row_str = f"{rows:,}" if rows is not None else "—"
 
-            status_emoji = {
-                "success": "✅",
-                "error": "❌",
-                "timeout": "⏱️",
-            }.get(status, "❓")
-
-            lines.append(f"| {query.upper()} | {time_str} | {status_emoji} | {row_str} |")
+            status_emoji = STATUS_EMOJI.get(status, "❓")
 
-        lines.extend([
-            "",
-            "</details>",
-            "",
-        ])
+            yield f"| {query.upper()} | {time_str} | {status_emoji} | {row_str} |"
 
-    # Add error details if any
-    has_errors = False
-    error_lines = ["## ⚠️ Errors and Timeouts", ""]
-
-    for engine in engines:
-        engine_errors = []
-        for query in all_queries:
-            result = data.get(engine, {}).get(query, {})
-            if result.get("status") in ("error", "timeout"):
-                error_msg = result.get("error_message", "No details available")
+            if status in ("error", "timeout"):
+                error_msg = data[engine][query].get("error_message") or "No details available"
                 # Truncate long error messages
                 if len(error_msg) > 200:
                     error_msg = error_msg[:200] + "..."
                 engine_errors.append(f"- **{query.upper()}**: `{error_msg}`")
 
         if engine_errors:
-            has_errors = True
-            icon_name = engine_icons.get(engine, engine.title())
-            error_lines.append(f"### {icon_name}")
-            error_lines.append("")
-            error_lines.extend(engine_errors)
-            error_lines.append("")
+            errors[engine] = engine_errors
+
+        yield from [
+            "",
+            "</details>",
+            "",
+        ]
 
-    if has_errors:
-        lines.extend(error_lines)
+    # Add error details if any
+    if errors:
+        yield from ["## ⚠️ Errors and Timeouts", ""]
+        for engine, engine_errors in errors.items():
+            icon_name = ENGINE_ICONS.get(engine, engine.title())
+            yield from [f"### {icon_name}", ""]
+            yield from engine_errors
+            yield ""
 
     # Footer
-    lines.extend([
+    yield from [
         "---",
         "",
         "| Legend | Meaning |",
@@ -250,15 +298,29 @@ def generate_markdown_summary(results: dict, output_file: str, query_timeout: in
         "| ❌ ERROR | Query failed |",
         "",
         f"*Generated by [SpatialBench](https://github.com/apache/sedona-spatialbench) on {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}*",
-    ])
+    ]
+
 
-    markdown = "\n".join(lines)
+def generate_markdown_summary(results: dict, output_file: str, query_timeout: int | None = None, runs: int | None = None,
+                              preview_chars: int = 2000) -> str:
+    """Generate a markdown summary of benchmark results for GitHub Actions.
 
-    # Write to file
-    with open(output_file, "w") as f:
-        f.write(markdown)
+    Lines are written to ``output_file`` as they are generated. Only the start
+    of the markdown is returned, for the preview printed by main(): at most
+    ``preview_chars + 1`` characters, so callers can tell whether it was cut.
+    """
+    preview = []
+    preview_len = 0
+    with open(output_file, "w", buffering=1 << 16) as f:
+        separator = ""
+        for line in _markdown_lines(results, query_timeout, runs):
+            f.write(separator + line)
+            if preview_len <= preview_chars:
+                preview.append(separator + line)
+                preview_len += len(separator) + len(line)
+            separator = "\n"
 
-    return markdown
+    return "".join(preview)[:preview_chars + 1]
 
 
 def main():
@@ -296,10 +358,6 @@ def main():
 
     if not results:
         print(f"No results found in {args.results_dir}")
-        # Write empty summary
-        with open(args.output, "w") as f:
-            f.write("# SpatialBench Benchmark Results\n\nNo results found.")
-        return
 
     markdown = generate_markdown_summary(results, args.output, args.timeout, args.runs)
     print(f"Summary written to {args.output}")
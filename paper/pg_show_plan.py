@@ -1,5 +1,11 @@
 import psycopg
 import os
+import re
+
+# Plan lines worth highlighting; GPU nodes take precedence over risky joins
+# when a line mentions both, so each is searched for separately
+GPU_TAG = re.compile(r"Gpu")
+JOIN_TAG = re.compile(r"Nested Loop")
 
 def check_plan():
     user = os.environ.get("USER")
@@ -31,9 +37,9 @@ ORDER BY nearby_pickup_count DESC, b.b_buildingkey ASC"""
         for row in plan_rows:
             line = row[0]
             # Highlight key indicators
-            if "Gpu" in line:
+            if GPU_TAG.search(line):
                 print(f"--> \033[92m{line}\033[0m") # Green for GPU
-            elif "Nested Loop" in line:
+            elif JOIN_TAG.search(line):
                 print(f"--> \033[91m{line}\033[0m") # Red for risky joins
             else:
                 print(line)
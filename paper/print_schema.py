@@ -1,4 +1,4 @@
-import pyarrow.parquet as pq
+import pyarrow.dataset as ds
 import os
 
 # Adjust this path if your data folder has a different name
@@ -6,24 +6,23 @@ data_dir = "benchmark-data-sf1"
 
 print(f"Scanning directory: {data_dir}\n")
 
-for root, dirs, files in os.walk(data_dir):
-    # Sort files to ensure deterministic output
-    files.sort()
-    for file in files:
-        if file.endswith(".parquet"):
-            path = os.path.join(root, file)
-            print(f"==========================================")
-            print(f"File: {os.path.basename(root)}/{file}")
-            print(f"==========================================")
-            try:
-                # Read schema
-                schema = pq.read_schema(path)
-                for name, type in zip(schema.names, schema.types):
-                    # Print exact column name and Arrow type
-                    print(f"{name:<20} | {type}")
-            except Exception as e:
-                print(f"Error reading schema: {e}")
+# Each table is either a folder of parquet files or a single .parquet file
+with os.scandir(data_dir) as entries:
+    tables = sorted(
+        (entry for entry in entries if entry.is_dir() or entry.name.endswith(".parquet")),
+        key=lambda entry: entry.name,
+    )
 
-            # We only need to check one file per table/folder
-            break
+for entry in tables:
+    print(f"==========================================")
+    print(f"Table: {entry.name}")
+    print(f"==========================================")
+    try:
+        # Arrow discovers the files and reads the schema from the first one
+        schema = ds.dataset(entry.path, format="parquet").schema
+        for name, type in zip(schema.names, schema.types):
+            # Print exact column name and Arrow type
+            print(f"{name:<20} | {type}")
+    except Exception as e:
+        print(f"Error reading schema: {e}")
     print("")
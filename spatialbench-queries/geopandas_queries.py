@@ -16,31 +16,61 @@
 #  under the License.
 from typing import cast
 
-import geopandas as gpd
 import numpy as np
 import pandas as pd
+import shapely
 
 from pandas import DataFrame
-from shapely import wkb
-from shapely.geometry import LineString, MultiPoint, Point, Polygon
+from shapely.geometry import Polygon
+
+
+def _wkb_array(values) -> np.ndarray:
+    """Decode a column of WKB into an array of shapely geometries."""
+    return shapely.from_wkb(np.asarray(values, dtype=object))
+
+
+def _duration_seconds(df: DataFrame) -> np.ndarray:
+    """Trip durations in seconds, subtracted on the raw datetime64 arrays."""
+    return (df["t_dropofftime"].to_numpy() - df["t_pickuptime"].to_numpy()) / np.timedelta64(1, "s")
+
+
+def _pickup_month(df: DataFrame) -> np.ndarray:
+    """Pickup times truncated to the first of their month, in the column's own resolution."""
+    pickup = df["t_pickuptime"].to_numpy()
+    return pickup.astype("datetime64[M]").astype(pickup.dtype)
+
+
+def _load_zones(path: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, shapely.STRtree]:
+    """Load zones as (keys, names, geometries, STRtree)."""
+    zone_df = pd.read_parquet(path, columns=["z_zonekey", "z_name", "z_boundary"])
+    geoms = _wkb_array(zone_df["z_boundary"])
+    return zone_df["z_zonekey"].to_numpy(), zone_df["z_name"].to_numpy(), geoms, shapely.STRtree(geoms)
+
+
+def _load_buildings(path: str) -> tuple[np.ndarray, np.ndarray, np.ndarray, shapely.STRtree]:
+    """Load buildings as (keys, names, geometries, STRtree)."""
+    building_df = pd.read_parquet(path, columns=["b_buildingkey", "b_name", "b_boundary"])
+    geoms = _wkb_array(building_df["b_boundary"])
+    return building_df["b_buildingkey"].to_numpy(), building_df["b_name"].to_numpy(), geoms, shapely.STRtree(geoms)
 
 
 def q1(data_paths: dict[str, str]) -> DataFrame:  # type: ignore[override]
     """Q1 (GeoPandas): Trips starting within 50km of Sedona city center."""
-    trip_df = pd.read_parquet(data_paths["trip"])[
-        ["t_tripkey", "t_pickuploc", "t_pickuptime"]
-    ]
-    trip_df["pickup_geom"] = gpd.GeoSeries.from_wkb(
-        trip_df["t_pickuploc"], crs="EPSG:4326"
-    )
-    trip_gdf = gpd.GeoDataFrame(trip_df, geometry="pickup_geom", crs="EPSG:4326")
-    trip_gdf["pickup_lon"] = trip_gdf.geometry.x
-    trip_gdf["pickup_lat"] = trip_gdf.geometry.y
-    center = Point(-111.7610, 34.8697)
-    trip_gdf["distance_to_center"] = trip_gdf.geometry.distance(center)
-    filtered = trip_gdf[
-        trip_gdf["distance_to_center"].notna()
-        & (trip_gdf["distance_to_center"] <= 0.45)
+    trip_df = pd.read_parquet(
+        data_paths["trip"], columns=["t_tripkey", "t_pickuploc", "t_pickuptime"]
+    )
+    # Point-to-point distance is plain planar math on the coordinates, so no
+    # geometry objects are needed beyond decoding the WKB (missing points give NaN)
+    pickup_geoms = _wkb_array(trip_df["t_pickuploc"])
+    trip_df["pickup_lon"] = shapely.get_x(pickup_geoms)
+    trip_df["pickup_lat"] = shapely.get_y(pickup_geoms)
+    trip_df["distance_to_center"] = np.hypot(
+        trip_df["pickup_lon"].to_numpy() - (-111.7610),
+        trip_df["pickup_lat"].to_numpy() - 34.8697,
+    )
+    filtered = trip_df[
+        trip_df["distance_to_center"].notna()
+        & (trip_df["distance_to_center"] <= 0.45)
         ]
     return filtered.sort_values(  # type: ignore[no-any-return]
         ["distance_to_center", "t_tripkey"], ascending=[True, True]
@@ -62,18 +92,17 @@ def q2(data_paths: dict[str, str]) -> DataFrame:  # type: ignore[override]
     pickup point intersects that polygon. Returns single-row DataFrame with
     trip_count_in_coconino_county.
     """
-    trip_df = pd.read_parquet(data_paths["trip"])
-    zone_df = pd.read_parquet(data_paths["zone"])
-    target = zone_df[zone_df["z_name"] == "Coconino County"].head(1)
-    if target.empty:
+    trip_df = pd.read_parquet(data_paths["trip"], columns=["t_pickuploc"])
+    _, zone_names, zone_geoms, _ = _load_zones(data_paths["zone"])
+    target = np.flatnonzero(zone_names == "Coconino County")
+    if len(target) == 0:
         return pd.DataFrame({"trip_count_in_coconino_county": [0]})
-    poly = wkb.loads(target.iloc[0]["z_boundary"])
-    trip_df["pickup_geom"] = gpd.GeoSeries.from_wkb(
-        trip_df["t_pickuploc"], crs="EPSG:4326"
-    )
-    # Ensure intersects is called on a GeoSeries, not a Series
-    pickup_geoms = gpd.GeoSeries(trip_df["pickup_geom"], crs="EPSG:4326")
-    count = int(pickup_geoms.intersects(poly).sum())
+    poly = zone_geoms[target[0]]
+    shapely.prepare(poly)
+    pickup_geoms = _wkb_array(trip_df["t_pickuploc"])
+    x = shapely.get_x(pickup_geoms)
+    y = shapely.get_y(pickup_geoms)
+    count = int(np.count_nonzero(shapely.intersects_xy(poly, x, y)))
     return pd.DataFrame({"trip_count_in_coconino_county": [count]})
 
 
@@ -89,34 +118,32 @@ def q3(data_paths: dict[str, str]) -> DataFrame:  # type: ignore[override]
     Ordered by pickup_month ASC.
     Returns columns: pickup_month, total_trips, avg_distance, avg_duration, avg_fare
     """
-    trip_df = pd.read_parquet(data_paths["trip"])
-
-    trip_df["pickup_geom"] = gpd.GeoSeries.from_wkb(
-        trip_df["t_pickuploc"], crs="EPSG:4326"
-    )
-    trips_gdf = gpd.GeoDataFrame(trip_df, geometry="pickup_geom", crs="EPSG:4326")
-
-    base_poly = Polygon(
-        [
-            (-111.9060, 34.7347),
-            (-111.6160, 34.7347),
-            (-111.6160, 35.0047),
-            (-111.9060, 35.0047),
-            (-111.9060, 34.7347),
-        ]
+    trip_df = pd.read_parquet(
+        data_paths["trip"],
+        columns=[
+            "t_tripkey",
+            "t_pickuploc",
+            "t_pickuptime",
+            "t_dropofftime",
+            "t_distance",
+            "t_fare",
+        ],
     )
+    pickup_geoms = _wkb_array(trip_df["t_pickuploc"])
 
-    distances = trips_gdf["pickup_geom"].distance(base_poly)
-    mask = distances <= 0.045
-    filtered = trips_gdf.loc[mask]
+    # The base polygon is an axis-aligned box, so the point-to-polygon distance is the
+    # length of the per-axis overshoot beyond the box edges (zero inside)
+    minx, miny, maxx, maxy = -111.9060, 34.7347, -111.6160, 35.0047
+    x = shapely.get_x(pickup_geoms)
+    y = shapely.get_y(pickup_geoms)
+    dx = np.maximum(np.maximum(minx - x, x - maxx), 0.0)
+    dy = np.maximum(np.maximum(miny - y, y - maxy), 0.0)
+    mask = np.hypot(dx, dy) <= 0.045
+    filtered = trip_df.loc[mask]
 
-    filtered["_duration_seconds"] = (
-            filtered["t_dropofftime"] - filtered["t_pickuptime"]
-    ).dt.total_seconds()
+    filtered["_duration_seconds"] = _duration_seconds(filtered)
 
-    filtered["pickup_month"] = (
-        filtered["t_pickuptime"].dt.to_period("M").dt.to_timestamp()
-    )
+    filtered["pickup_month"] = _pickup_month(filtered)
 
     agg = (
         filtered.groupby("pickup_month", as_index=False)
@@ -145,61 +172,75 @@ def q4(data_paths: dict[str, str]) -> DataFrame:  # type: ignore[override]
     trip_df = pd.read_parquet(data_paths["trip"])
     if "t_tip" not in trip_df.columns:
         return pd.DataFrame(columns=["z_zonekey", "z_name", "trip_count"])
+    # Only rows tipping at least the 1000th largest tip can make the cut, so select
+    # that threshold in linear time and sort just those rows (ties stay included)
+    tip = trip_df["t_tip"].to_numpy(dtype=float)
+    valid_tip = tip[~np.isnan(tip)]
+    if len(valid_tip) > 1000:
+        threshold = np.partition(valid_tip, len(valid_tip) - 1000)[len(valid_tip) - 1000]
+        trip_df = trip_df.iloc[np.flatnonzero(tip >= threshold)]
     top_trips = trip_df.sort_values(
         ["t_tip", "t_tripkey"], ascending=[False, True]
     ).head(1000)
-    top_trips["pickup_geom"] = gpd.GeoSeries.from_wkb(
-        top_trips["t_pickuploc"], crs="EPSG:4326"
-    )
-    top_gdf = gpd.GeoDataFrame(top_trips, geometry="pickup_geom", crs="EPSG:4326")
-    zone_df = pd.read_parquet(data_paths["zone"])[
-        ["z_zonekey", "z_name", "z_boundary"]
-    ]
-    zone_df["zone_geom"] = gpd.GeoSeries.from_wkb(
-        zone_df["z_boundary"], crs="EPSG:4326"
-    )
-    zones_gdf = gpd.GeoDataFrame(zone_df, geometry="zone_geom", crs="EPSG:4326")[
-        ["z_zonekey", "z_name", "zone_geom"]
-    ]
+    pickup_geoms = _wkb_array(top_trips["t_pickuploc"])
+    zone_keys, zone_names, _, zone_tree = _load_zones(data_paths["zone"])
 
+    _, zone_idx = zone_tree.query(pickup_geoms, predicate="within")
+    counts = np.bincount(zone_idx, minlength=len(zone_keys))
+    hit = counts > 0
     result = (
-        gpd.sjoin(top_gdf, zones_gdf, how="inner", predicate="within")
-        .groupby(["z_zonekey", "z_name"], as_index=False)
-        .size()
-        .rename(columns={"size": "trip_count"})
+        pd.DataFrame(
+            {
+                "z_zonekey": zone_keys[hit],
+                "z_name": zone_names[hit],
+                "trip_count": counts[hit],
+            }
+        )
         .sort_values(["trip_count", "z_zonekey"], ascending=[False, True])
         .reset_index(drop=True)
     )
-    return result  # type: ignore[no-any-return]
+    return result
 
 
 def q5(data_paths: dict[str, str]) -> DataFrame:  # type: ignore[override]
     """Q5 (GeoPandas): Monthly travel patterns for repeat customers (convex hull of dropoff points)."""
-    trip_df = pd.read_parquet(data_paths["trip"])
-    cust_df = pd.read_parquet(data_paths["customer"])
-    trip_df["dropoff_geom"] = gpd.GeoSeries.from_wkb(
-        trip_df["t_dropoffloc"], crs="EPSG:4326"
+    trip_df = pd.read_parquet(
+        data_paths["trip"],
+        columns=[
+            "t_tripkey",
+            "t_custkey",
+            "t_pickuptime",
+            "t_dropoffloc",
+        ],
     )
+    cust_df = pd.read_parquet(data_paths["customer"], columns=["c_custkey", "c_name"])
     joined = trip_df.merge(
         cust_df[["c_custkey", "c_name"]],
         left_on="t_custkey",
         right_on="c_custkey",
         how="inner",
     )
-    joined["pickup_month"] = (
-        joined["t_pickuptime"].dt.to_period("M").dt.to_timestamp()
+    joined["pickup_month"] = _pickup_month(joined)
+    dropoff_geoms = _wkb_array(joined["t_dropoffloc"])
+    dropoff_xy = np.column_stack(
+        (shapely.get_x(dropoff_geoms), shapely.get_y(dropoff_geoms))
     )
-    grouped = (
-        joined.groupby(["c_custkey", "c_name", "pickup_month"], as_index=False)
-        .agg(
-            trip_count=("t_tripkey", "count"),
-            dropoff_points=("dropoff_geom", lambda x: list(x)),
-        )
-        .loc[lambda d: d["trip_count"] > 5]
+
+    groups = joined.groupby(["c_custkey", "c_name", "pickup_month"])
+    grouped = groups.agg(trip_count=("t_tripkey", "count")).reset_index()
+    kept = np.flatnonzero(grouped["trip_count"].to_numpy() > 5)
+
+    # Give each kept group a dense slot (-1 for filtered groups and rows without a group),
+    # order rows by slot and build every group's MultiPoint from the sorted coordinates at once
+    slot = np.full(len(grouped) + 1, -1)
+    slot[kept] = np.arange(len(kept))
+    row_slot = slot[groups.ngroup().to_numpy()]
+    rows = np.flatnonzero(row_slot >= 0)
+    rows = rows[np.argsort(row_slot[rows], kind="stable")]
+    hulls = shapely.convex_hull(
+        shapely.multipoints(dropoff_xy[rows], indices=row_slot[rows])
     )
-    grouped["monthly_travel_hull_area"] = gpd.GeoSeries(
-        grouped["dropoff_points"].map(MultiPoint), crs="EPSG:4326"
-    ).convex_hull.area
+    grouped = grouped.iloc[kept].assign(monthly_travel_hull_area=shapely.area(hulls))
 
     result = (
         grouped.sort_values(["trip_count", "c_custkey"], ascending=[False, True])[
@@ -219,27 +260,24 @@ def q6(data_paths: dict[str, str]) -> DataFrame:  # type: ignore[override]
       * Count trips whose pickup point lies within each zone (inner semantics: zones with 0 pickups excluded).
       * Compute:
           total_pickups = COUNT(t_tripkey)
-          avg_distance  = AVG(t_totalamount) (matches original aliasing; falls back to t_distance if needed)
+          avg_distance  = AVG(t_totalamount) (matches original aliasing)
           avg_duration  = AVG(t_dropofftime - t_pickuptime) in seconds
       * Order by total_pickups DESC, z_zonekey ASC.
     Returns DataFrame with columns: z_zonekey, z_name, total_pickups, avg_distance, avg_duration
     """
-    trip_df = pd.read_parquet(data_paths["trip"])
-    zone_df = pd.read_parquet(data_paths["zone"])
-
-    trip_df["pickup_geom"] = gpd.GeoSeries.from_wkb(
-        trip_df["t_pickuploc"], crs="EPSG:4326"
-    )
-    pickup_points = gpd.GeoDataFrame(
-        trip_df, geometry="pickup_geom", crs="EPSG:4326"
+    trip_df = pd.read_parquet(
+        data_paths["trip"],
+        columns=[
+            "t_tripkey",
+            "t_pickuploc",
+            "t_pickuptime",
+            "t_dropofftime",
+            "t_totalamount",
+        ],
     )
+    zone_keys, zone_names, zone_geoms, zone_tree = _load_zones(data_paths["zone"])
 
-    zone_df["zone_geom"] = gpd.GeoSeries.from_wkb(
-        zone_df["z_boundary"], crs="EPSG:4326"
-    )
-    zones_gdf = gpd.GeoDataFrame(zone_df, geometry="zone_geom", crs="EPSG:4326")[
-        ["z_zonekey", "z_name", "zone_geom"]
-    ]
+    pickup_geoms = _wkb_array(trip_df["t_pickuploc"])
 
     bbox_poly = Polygon(
         [
@@ -251,29 +289,27 @@ def q6(data_paths: dict[str, str]) -> DataFrame:  # type: ignore[override]
         ]
     )
 
-    candidate_zones = zones_gdf[
-        zones_gdf["zone_geom"].notna()
-        & zones_gdf["zone_geom"].intersects(bbox_poly)
-        ]
+    # Shapely only uses the prepared index of the first argument
+    shapely.prepare(bbox_poly)
+    candidate = shapely.intersects(bbox_poly, zone_geoms)
 
-    distance_col = (
-        "t_totalamount"
-        if "t_totalamount" in trip_df.columns
-        else ("t_distance" if "t_distance" in trip_df.columns else None)
+    trip_idx, zone_idx = zone_tree.query(pickup_geoms, predicate="within")
+    keep = candidate[zone_idx]
+    trip_idx, zone_idx = trip_idx[keep], zone_idx[keep]
+    trip_cols = ["t_tripkey", "t_pickuptime", "t_dropofftime", "t_totalamount"]
+    joined = trip_df[trip_cols].iloc[trip_idx].assign(
+        z_zonekey=zone_keys[zone_idx],
+        z_name=zone_names[zone_idx],
     )
 
     result = (
-        gpd.sjoin(pickup_points, candidate_zones, how="inner", predicate="within")
-        .assign(
-            _duration_seconds=lambda d: (
-                    d["t_dropofftime"] - d["t_pickuptime"]
-            ).dt.total_seconds(),
-            _distance_metric=lambda d: d[distance_col] if distance_col else pd.NA,
+        joined.assign(
+            _duration_seconds=_duration_seconds,
         )
         .groupby(["z_zonekey", "z_name"], as_index=False)
         .agg(
             total_pickups=("t_tripkey", "count"),
-            avg_distance=("_distance_metric", "mean"),
+            avg_distance=("t_totalamount", "mean"),
             avg_duration=("_duration_seconds", "mean"),
         )
         .sort_values(["total_pickups", "z_zonekey"], ascending=[False, True])
@@ -293,25 +329,26 @@ def q7(data_paths: dict[str, str]) -> DataFrame:  # type: ignore[override]
       * detour_ratio = (reported_distance_m) / line_distance_m (NULL if line_distance_m==0)
       * Ordered by detour_ratio DESC, reported_distance_m DESC, t_tripkey ASC
     """
-    trip_df = pd.read_parquet(data_paths["trip"])
-    trip_df["pickup_geom"] = gpd.GeoSeries.from_wkb(
-        trip_df["t_pickuploc"], crs="EPSG:4326"
-    )
-    trip_df["dropoff_geom"] = gpd.GeoSeries.from_wkb(
-        trip_df["t_dropoffloc"], crs="EPSG:4326"
+    trip_df = pd.read_parquet(
+        data_paths["trip"],
+        columns=[
+            "t_tripkey",
+            "t_distance",
+            "t_pickuploc",
+            "t_dropoffloc",
+        ],
     )
     trip_df["reported_distance_m"] = trip_df["t_distance"].astype(float)
-    pickup_vals = trip_df["pickup_geom"].to_numpy()
-    dropoff_vals = trip_df["dropoff_geom"].to_numpy()
-    line_lengths = np.fromiter(
-        (
-            LineString([pg, dg]).length / 0.000009  # 1 meter = 0.000009 degree
-            if (pg is not None and dg is not None)
-            else np.nan
-            for pg, dg in zip(pickup_vals, dropoff_vals, strict=False)
-        ),
-        dtype=float,
-        count=len(trip_df),
+    pickup_vals = _wkb_array(trip_df["t_pickuploc"])
+    dropoff_vals = _wkb_array(trip_df["t_dropoffloc"])
+    # The straight line between two points is just their Euclidean distance;
+    # get_x/get_y return NaN for missing points, so those rows stay NaN
+    line_lengths = (
+        np.hypot(
+            shapely.get_x(pickup_vals) - shapely.get_x(dropoff_vals),
+            shapely.get_y(pickup_vals) - shapely.get_y(dropoff_vals),
+        )
+        / 0.000009  # 1 meter = 0.000009 degree
     )
     trip_df["line_distance_m"] = line_lengths
     trip_df["detour_ratio"] = np.divide(
@@ -343,28 +380,26 @@ def q7(data_paths: dict[str, str]) -> DataFrame:  # type: ignore[override]
 
 def q8(data_paths: dict[str, str]) -> DataFrame:  # type: ignore[override]
     """Q8 (GeoPandas): Count nearby pickups for each building within ~500m."""
-    trips_df = pd.read_parquet(data_paths["trip"])
-    trips_df["pickup_geom"] = gpd.GeoSeries.from_wkb(
-        trips_df["t_pickuploc"], crs="EPSG:4326"
-    )
-    pickups_gdf = gpd.GeoDataFrame(
-        trips_df, geometry="pickup_geom", crs="EPSG:4326"
-    )
+    trips_df = pd.read_parquet(data_paths["trip"], columns=["t_pickuploc"])
+    pickup_geoms = _wkb_array(trips_df["t_pickuploc"])
 
-    buildings_df = pd.read_parquet(data_paths["building"])
-    buildings_df["boundary_geom"] = gpd.GeoSeries.from_wkb(
-        buildings_df["b_boundary"], crs="EPSG:4326"
-    )
-    buildings_gdf = gpd.GeoDataFrame(
-        buildings_df, geometry="boundary_geom", crs="EPSG:4326"
-    )
+    building_keys, building_names, _, building_tree = _load_buildings(data_paths["building"])
 
     threshold = 0.0045  # degrees (~500m)
+    _, building_idx = building_tree.query(
+        pickup_geoms, predicate="dwithin", distance=threshold
+    )
+    counts = np.bincount(building_idx, minlength=len(building_keys))
+    # Buildings without pickups, or with a null name (dropped by a group-by), are not reported
+    hit = (counts > 0) & pd.notna(building_names)
     result = (
-        buildings_gdf.sjoin(pickups_gdf, predicate="dwithin", distance=threshold)
-        .groupby(["b_buildingkey", "b_name"], as_index=False)
-        .size()
-        .rename(columns={"size": "nearby_pickup_count"})
+        pd.DataFrame(
+            {
+                "b_buildingkey": building_keys[hit],
+                "b_name": building_names[hit],
+                "nearby_pickup_count": counts[hit],
+            }
+        )
         .sort_values(
             ["nearby_pickup_count", "b_buildingkey"], ascending=[False, True]
         )
@@ -376,61 +411,38 @@ def q8(data_paths: dict[str, str]) -> DataFrame:  # type: ignore[override]
 def q9(data_paths: dict[str, str]) -> DataFrame:  # type: ignore[override]
     """Q9 (GeoPandas): Building conflation via IoU (intersection over union) detection.
 
-    Uses spatial self-join (predicate='intersects') to find overlapping (intersecting) building boundary polygons.
-    Robust to differing GeoPandas suffix behaviors by detecting column names and falling back to index_right.
+    Uses an STRtree self-query (predicate='intersects') to find overlapping (intersecting) building boundary polygons.
     Output columns: building_1, building_2, area1, area2, overlap_area, iou ordered by
     iou DESC, building_1 ASC, building_2 ASC.
     """
-    buildings_df = pd.read_parquet(data_paths["building"])
-    buildings_df["boundary_geom"] = gpd.GeoSeries.from_wkb(
-        buildings_df["b_boundary"], crs="EPSG:4326"
-    )
-    bdf = gpd.GeoDataFrame(buildings_df, geometry="boundary_geom", crs="EPSG:4326")[
-        ["b_buildingkey", "boundary_geom"]
-    ].rename(columns={"b_buildingkey": "building_key"})
-
-    pairs = gpd.sjoin(bdf, bdf, how="inner", predicate="intersects")
-
-    left_key_candidates = ["building_key_left", "building_key_1", "building_key"]
-    right_key_candidates = ["building_key_right", "building_key_2"]
-    left_key_col = next(c for c in left_key_candidates if c in pairs.columns)
-    right_key_col = next(
-        (c for c in right_key_candidates if c in pairs.columns), None
-    )
-    if right_key_col is None:
-        pairs["_building_key_right_temp"] = bdf.loc[
-            pairs["index_right"], "building_key"
-        ].to_numpy()
-        right_key_col = "_building_key_right_temp"
-
-    pairs = pairs.rename(
-        columns={left_key_col: "building_1", right_key_col: "building_2"}
-    ).rename_geometry("boundary_geom_1")
-    pairs["boundary_geom_2"] = bdf.loc[
-        pairs["index_right"], "boundary_geom"
-    ].to_numpy()
-
-    # Filter to only building_1 < building_2 (exclude self-pairs)
-    pairs = pairs[pairs["building_1"] < pairs["building_2"]]
-
-    # Compute metrics
-    boundary_geom_1_gs = gpd.GeoSeries(pairs["boundary_geom_1"], crs=pairs.crs)
-    boundary_geom_2_gs = gpd.GeoSeries(pairs["boundary_geom_2"], crs=pairs.crs)
-    pairs["area1"] = boundary_geom_1_gs.area
-    pairs["area2"] = boundary_geom_2_gs.area
-    intersection = boundary_geom_1_gs.intersection(boundary_geom_2_gs)
-    pairs["overlap_area"] = intersection.area
-    overlap = pairs["overlap_area"].to_numpy(dtype=float, copy=False)
-    area1 = pairs["area1"].to_numpy(dtype=float, copy=False)
-    area2 = pairs["area2"].to_numpy(dtype=float, copy=False)
+    building_keys, _, building_geoms, building_tree = _load_buildings(data_paths["building"])
+
+    left_idx, right_idx = building_tree.query(building_geoms, predicate="intersects")
+    # Keep building_1 < building_2 (excludes self-pairs and mirrored duplicates)
+    keep = building_keys[left_idx] < building_keys[right_idx]
+    left_idx, right_idx = left_idx[keep], right_idx[keep]
+
+    geoms_1 = building_geoms[left_idx]
+    geoms_2 = building_geoms[right_idx]
+    overlap = shapely.area(shapely.intersection(geoms_1, geoms_2))
+    area1 = shapely.area(geoms_1)
+    area2 = shapely.area(geoms_2)
     union = area1 + area2 - overlap
     iou = np.divide(overlap, union, out=np.zeros_like(overlap), where=union != 0.0)
     mask_union_zero = (union == 0.0) & (overlap > 0.0)
     if mask_union_zero.any():
         iou[mask_union_zero] = 1.0
-    pairs["iou"] = iou
     result = (
-        pairs[["building_1", "building_2", "area1", "area2", "overlap_area", "iou"]]
+        pd.DataFrame(
+            {
+                "building_1": building_keys[left_idx],
+                "building_2": building_keys[right_idx],
+                "area1": area1,
+                "area2": area2,
+                "overlap_area": overlap,
+                "iou": iou,
+            }
+        )
         .sort_values(
             ["iou", "building_1", "building_2"], ascending=[False, True, True]
         )
@@ -446,20 +458,34 @@ def q10(data_paths: dict[str, str]) -> DataFrame:  # type: ignore[override]
     Ordered by avg_duration DESC (NULLS last), z_zonekey ASC.
     Zones with zero trips retained (avg_* = NaN, num_trips = 0).
     """
-    trip_df = pd.read_parquet(data_paths["trip"])
-    zone_df = pd.read_parquet(data_paths["zone"])
-
-    trip_df["pickup_geom"] = gpd.GeoSeries.from_wkb(
-        trip_df["t_pickuploc"], crs="EPSG:4326"
-    )
-    pickup_points = gpd.GeoDataFrame(
-        trip_df, geometry="pickup_geom", crs="EPSG:4326"
+    trip_df = pd.read_parquet(
+        data_paths["trip"],
+        columns=[
+            "t_tripkey",
+            "t_distance",
+            "t_pickuptime",
+            "t_dropofftime",
+            "t_pickuploc",
+        ],
     )
+    zone_keys, zone_names, _, zone_tree = _load_zones(data_paths["zone"])
 
-    zone_df["zone_geom"] = gpd.GeoSeries.from_wkb(
-        zone_df["z_boundary"], crs="EPSG:4326"
+    pickup_geoms = _wkb_array(trip_df["t_pickuploc"])
+    trip_idx, zone_idx = zone_tree.query(pickup_geoms, predicate="within")
+    matched = (
+        trip_df[["t_tripkey", "t_distance", "t_pickuptime", "t_dropofftime"]]
+        .iloc[trip_idx]
+        .assign(
+            z_zonekey=zone_keys[zone_idx],
+            z_name=zone_names[zone_idx],
+        )
+    )
+    # Right join semantics: zones without any pickup are kept with empty trip columns
+    unmatched_idx = np.setdiff1d(np.arange(len(zone_keys)), zone_idx)
+    unmatched = pd.DataFrame(
+        {"z_zonekey": zone_keys[unmatched_idx], "z_name": zone_names[unmatched_idx]}
     )
-    zones_gdf = gpd.GeoDataFrame(zone_df, geometry="zone_geom", crs="EPSG:4326")
+    joined = pd.concat([matched, unmatched], ignore_index=True)
 
     aggregations = {
         "duration_seconds": "mean",
@@ -467,11 +493,8 @@ def q10(data_paths: dict[str, str]) -> DataFrame:  # type: ignore[override]
         "t_tripkey": "count",
     }
     result = (
-        gpd.sjoin(pickup_points, zones_gdf, how="right", predicate="within")
-        .assign(
-            duration_seconds=lambda d: (
-                    d["t_dropofftime"] - d["t_pickuptime"]
-            ).dt.total_seconds()
+        joined.assign(
+            duration_seconds=_duration_seconds
         )
         .groupby(["z_zonekey", "z_name"], dropna=False)
         .agg(aggregations)
@@ -500,125 +523,128 @@ def q11(data_paths: dict[str, str]) -> DataFrame:  # type: ignore[override]
 
     Returns a single-row DataFrame with column: cross_zone_trip_count
     """
-    trip_df = pd.read_parquet(data_paths["trip"])
-    zone_df = pd.read_parquet(data_paths["zone"])
-
-    pickup_df = trip_df[["t_tripkey", "t_pickuploc"]].copy()
-    pickup_df["pickup_geom"] = gpd.GeoSeries.from_wkb(
-        pickup_df["t_pickuploc"], crs="EPSG:4326"
-    )
-    pickup_points = gpd.GeoDataFrame(
-        pickup_df, geometry="pickup_geom", crs="EPSG:4326"
+    trip_df = pd.read_parquet(
+        data_paths["trip"], columns=["t_tripkey", "t_pickuploc", "t_dropoffloc"]
     )
+    zone_keys, _, _, tree = _load_zones(data_paths["zone"])
 
-    dropoff_df = trip_df[["t_tripkey", "t_dropoffloc"]].copy()
-    dropoff_df["dropoff_geom"] = gpd.GeoSeries.from_wkb(
-        dropoff_df["t_dropoffloc"], crs="EPSG:4326"
+    pickup_trip, pickup_zone = tree.query(
+        _wkb_array(trip_df["t_pickuploc"]), predicate="within"
     )
-    dropoff_points = gpd.GeoDataFrame(
-        dropoff_df, geometry="dropoff_geom", crs="EPSG:4326"
+    dropoff_trip, dropoff_zone = tree.query(
+        _wkb_array(trip_df["t_dropoffloc"]), predicate="within"
     )
 
-    zones_pickup = (
-        zone_df[["z_zonekey", "z_boundary"]]
-        .rename(columns={"z_zonekey": "pickup_zonekey"})
-        .copy()
-    )
-    zones_pickup["zone_geom"] = gpd.GeoSeries.from_wkb(
-        zones_pickup["z_boundary"], crs="EPSG:4326"
-    )
-    zones_gdf = gpd.GeoDataFrame(
-        zones_pickup, geometry="zone_geom", crs="EPSG:4326"
-    )
-
-    zones_dropoff = (
-        zone_df[["z_zonekey", "z_boundary"]]
-        .rename(columns={"z_zonekey": "dropoff_zonekey"})
-        .copy()
-    )
-    zones_dropoff["zone_geom"] = gpd.GeoSeries.from_wkb(
-        zones_dropoff["z_boundary"], crs="EPSG:4326"
+    # Joining pickup and dropoff matches on the trip yields, per trip, every
+    # (pickup zone, dropoff zone) combination. Count them all, then subtract the
+    # combinations whose zone keys are equal, without materializing the join.
+    num_trips = len(trip_df)
+    total = int(
+        np.dot(
+            np.bincount(pickup_trip, minlength=num_trips),
+            np.bincount(dropoff_trip, minlength=num_trips),
+        )
     )
-    zones2_gdf = gpd.GeoDataFrame(
-        zones_dropoff, geometry="zone_geom", crs="EPSG:4326"
+    key_ids, key_index = np.unique(zone_keys, return_inverse=True)
+    pickup_codes, pickup_counts = np.unique(
+        pickup_trip.astype(np.int64) * len(key_ids) + key_index[pickup_zone],
+        return_counts=True,
     )
-
-    pickup_join = gpd.sjoin(
-        pickup_points,
-        zones_gdf,
-        how="left",
-        predicate="within",
+    dropoff_codes, dropoff_counts = np.unique(
+        dropoff_trip.astype(np.int64) * len(key_ids) + key_index[dropoff_zone],
+        return_counts=True,
     )
-    dropoff_join = gpd.sjoin(
-        dropoff_points,
-        zones2_gdf,
-        how="left",
-        predicate="within",
+    _, pickup_pos, dropoff_pos = np.intersect1d(
+        pickup_codes, dropoff_codes, assume_unique=True, return_indices=True
     )
+    same_zone = int(np.dot(pickup_counts[pickup_pos], dropoff_counts[dropoff_pos]))
 
-    merged = pickup_join[["t_tripkey", "pickup_zonekey"]].merge(
-        dropoff_join[["t_tripkey", "dropoff_zonekey"]], on="t_tripkey", how="inner"
-    )
-
-    mask = (
-            merged["pickup_zonekey"].notna()
-            & merged["dropoff_zonekey"].notna()
-            & (merged["pickup_zonekey"] != merged["dropoff_zonekey"])
-    )
-    count = int(mask.sum())
+    count = total - same_zone
     return pd.DataFrame({"cross_zone_trip_count": [count]})
 
 
 def q12(data_paths: dict[str, str]) -> DataFrame:  # type: ignore[override]
-    """Q12 (GeoPandas): Find 5 nearest buildings to each trip pickup location (NLJ, memory-efficient).
+    """Q12 (GeoPandas): Find 5 nearest buildings to each trip pickup location (KNN, memory-efficient).
 
-    Uses a Python loop (nested loop join) to avoid materializing the full cross join.
-    Optionally uses STRtree to shortlist candidate buildings for each pickup point.
+    Uses STRtree distance queries with a growing radius to shortlist candidate buildings for
+    each pickup point instead of materializing the full cross join.
     For each pickup, computes distances to candidates, selects 5 closest (ties by building key ASC).
     Output columns: t_tripkey, t_pickuploc, b_buildingkey, building_name, distance_to_building
     """
-    trips_df = pd.read_parquet(data_paths["trip"])
-    buildings_df = pd.read_parquet(data_paths["building"])
-
-    trips_df["pickup_geom"] = gpd.GeoSeries.from_wkb(
-        trips_df["t_pickuploc"], crs="EPSG:4326"
-    )
-    buildings_df["boundary_geom"] = gpd.GeoSeries.from_wkb(
-        buildings_df["b_boundary"], crs="EPSG:4326"
-    )
-    trips_gdf = gpd.GeoDataFrame(trips_df, geometry="pickup_geom", crs="EPSG:4326")
-    buildings_gdf = gpd.GeoDataFrame(
-        buildings_df, geometry="boundary_geom", crs="EPSG:4326"
-    )
-
-    pickup_geoms = trips_gdf["pickup_geom"].to_list()
-    building_geoms = buildings_gdf["boundary_geom"].to_list()
-    building_keys = buildings_gdf["b_buildingkey"].to_numpy()
-    building_names = buildings_gdf["b_name"].to_numpy()
-
-    results = []
-    # Since geopandas doesn't support KNN join, we had to choose either a cross join + filter or a NLJ.
-    # The cross join would be more pandas-esque, but would require too much memory.
-    # The NLJ is arguably methodologically unfair (a hand optimization) but the only way to
-    # actually get the query to run.
-    for i, pt in enumerate(pickup_geoms):
-        dists = [pt.distance(geom) for geom in building_geoms]
-        # Sort by distance, then building key
-        nearest_idx = np.lexsort((building_keys, dists))[:5]
-        for idx in nearest_idx:
-            results.append(
-                {
-                    "t_tripkey": trips_gdf.iloc[i]["t_tripkey"],
-                    "t_pickuploc": trips_gdf.iloc[i]["t_pickuploc"],
-                    "b_buildingkey": building_keys[idx],
-                    "building_name": building_names[idx],
-                    "distance_to_building": dists[idx],
-                }
-            )
+    trips_df = pd.read_parquet(data_paths["trip"], columns=["t_tripkey", "t_pickuploc"])
+    building_keys, building_names, building_geoms, building_tree = _load_buildings(data_paths["building"])
+
+    pickup_geoms = _wkb_array(trips_df["t_pickuploc"])
+    k = min(5, int(np.count_nonzero(~shapely.is_empty(building_geoms) & ~shapely.is_missing(building_geoms))))
+
+    # Since geopandas doesn't support KNN join, grow a per-pickup search radius until the
+    # STRtree returns at least k buildings within it. Any building at most as far as the
+    # k-th nearest one is then among the candidates, so ties on distance are kept too.
+    xmin, ymin, xmax, ymax = shapely.total_bounds(building_geoms)
+    spacing = max(xmax - xmin, ymax - ymin) * np.sqrt(k / max(len(building_geoms), 1))
+    if not spacing > 0:
+        spacing = 1.0
+    pending = np.flatnonzero(~shapely.is_empty(pickup_geoms) & ~shapely.is_missing(pickup_geoms))
+    # Seed each radius from the pickup's nearest building so outlying pickups start
+    # close to their answer instead of doubling their way out to it
+    radius = np.empty(0)
+    if len(pending) and k:
+        nearest_idx, nearest_dist = building_tree.query_nearest(
+            pickup_geoms[pending], return_distance=True, all_matches=False
+        )
+        radius = np.empty(len(pending))
+        radius[nearest_idx[0]] = nearest_dist + spacing
+    trip_parts, building_parts = [], []
+    while len(pending) and k:
+        trip_idx, building_idx = building_tree.query(
+            pickup_geoms[pending], predicate="dwithin", distance=radius
+        )
+        done = np.bincount(trip_idx, minlength=len(pending)) >= k
+        found = done[trip_idx]
+        trip_parts.append(pending[trip_idx[found]])
+        building_parts.append(building_idx[found])
+        pending = pending[~done]
+        radius = radius[~done] * 2
+    trip_idx = np.concatenate(trip_parts) if trip_parts else np.empty(0, dtype=np.intp)
+    building_idx = np.concatenate(building_parts) if building_parts else np.empty(0, dtype=np.intp)
+    dists = shapely.distance(pickup_geoms[trip_idx], building_geoms[building_idx])
+
+    # Order candidates by trip, then distance, then building key, and keep the first k per trip
+    order = np.lexsort((building_keys[building_idx], dists, trip_idx))
+    trip_idx, building_idx, dists = trip_idx[order], building_idx[order], dists[order]
+    starts = np.searchsorted(trip_idx, trip_idx, side="left")
+    nearest = np.arange(len(trip_idx)) - starts < k
+    trip_idx, building_idx, dists = trip_idx[nearest], building_idx[nearest], dists[nearest]
+
+    results = pd.DataFrame(
+        {
+            "t_tripkey": trips_df["t_tripkey"].to_numpy()[trip_idx],
+            "t_pickuploc": trips_df["t_pickuploc"].to_numpy()[trip_idx],
+            "b_buildingkey": building_keys[building_idx],
+            "building_name": building_names[building_idx],
+            "distance_to_building": dists,
+        }
+    )
     return (
-        pd.DataFrame(results)
+        results
         .sort_values(
             ["distance_to_building", "b_buildingkey"], ascending=[True, True]
         )
         .reset_index(drop=True)
     )
+
+
+QUERIES = {
+    "q1": q1,
+    "q2": q2,
+    "q3": q3,
+    "q4": q4,
+    "q5": q5,
+    "q6": q6,
+    "q7": q7,
+    "q8": q8,
+    "q9": q9,
+    "q10": q10,
+    "q11": q11,
+    "q12": q12,
+}
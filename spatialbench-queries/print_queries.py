@@ -15,55 +15,16 @@
 #  KIND, either express or implied.  See the License for the
 #  specific language governing permissions and limitations
 #  under the License.
-import inspect
-import re
 import sys
+import textwrap
 
 
-class SpatialBenchBenchmark:
-    """A benchmark for the performance of analytical spatial queries on a spatial dataset.
-
-    These queries are written in the Sedona/Spark SQL dialect. Because spatial functions are not as standardized as
-    other analytical functions, many engines needs specific implementations of a couple of these queries where dialects
-    vary slightly.
-
-    To deal with these differences,  other engine-specific implementations of this benchmark subclass this class and
-    override only the queries that need to be changed.
-
-    """
-
-    def queries(self) -> dict[str, str]:
-        """
-        Collects all methods of the subclass whose names start with 'q' followed by a number and have no arguments (other than self),
-        and returns them as a dictionary of query functions, partially applied with the current instance.
-
-        Returns:
-            Dict[str, str]: A dictionary mapping query names to their corresponding functions.
-        """
+def _sql(text: str) -> str:
+    """Dedent and strip a query literal once, at import time."""
+    return textwrap.dedent(text).strip()
 
-        queries = {}
-        for name, method in inspect.getmembers(
-                self.__class__, predicate=inspect.isfunction
-        ):
-            if re.fullmatch(r"q\d+", name):
-                sig = inspect.signature(method)
-                if len(sig.parameters) == 0:
-                    queries[name] = method()
-                else:
-                    raise ValueError("Query methods must not take any arguments")
 
-        # Sort queries numerically by extracting the number from the query name
-        sorted_queries = dict(sorted(queries.items(), key=lambda x: int(x[0][1:])))
-
-        return sorted_queries
-
-    def dialect(self) -> str:
-        """Return the dialect of the benchmark."""
-        return "SedonaSpark"
-
-    @staticmethod
-    def q1() -> str:
-        return """
+_Q1 = _sql("""
 -- Q1: Find trips starting within 50km of Sedona city center, ordered by distance
 SELECT
    t.t_tripkey, ST_X(ST_GeomFromWKB(t.t_pickuploc)) AS pickup_lon, ST_Y(ST_GeomFromWKB(t.t_pickuploc)) AS pickup_lat, t.t_pickuptime,
@@ -71,20 +32,16 @@ SELECT
 FROM trip t
 WHERE ST_DWithin(ST_GeomFromWKB(t.t_pickuploc), ST_GeomFromText('POINT (-111.7610 34.8697)'), 0.45) -- 50km radius around Sedona center
 ORDER BY distance_to_center ASC, t.t_tripkey ASC
-               """
+""")
 
-    @staticmethod
-    def q2() -> str:
-        return """
+_Q2 = _sql("""
 -- Q2: Count trips starting within Coconino County (Arizona) zone
 SELECT COUNT(*) AS trip_count_in_coconino_county
 FROM trip t
 WHERE ST_Intersects(ST_GeomFromWKB(t.t_pickuploc), (SELECT ST_GeomFromWKB(z.z_boundary) FROM zone z WHERE z.z_name = 'Coconino County' LIMIT 1))
-               """
+""")
 
-    @staticmethod
-    def q3() -> str:
-        return """
+_Q3 = _sql("""
 -- Q3: Monthly trip statistics within 15km radius of Sedona city center (10km base + 5km buffer)
 SELECT
    DATE_TRUNC('month', t.t_pickuptime) AS pickup_month, COUNT(t.t_tripkey) AS total_trips,
@@ -98,11 +55,9 @@ WHERE ST_DWithin(
      )
 GROUP BY pickup_month
 ORDER BY pickup_month
-"""
+""")
 
-    @staticmethod
-    def q4() -> str:
-        return """
+_Q4 = _sql("""
 -- Q4: Zone distribution of top 1000 trips by tip amount
 SELECT z.z_zonekey, z.z_name, COUNT(*) AS trip_count
 FROM
@@ -115,11 +70,9 @@ FROM
    ) top_trips ON ST_Within(ST_GeomFromWKB(top_trips.t_pickuploc), ST_GeomFromWKB(z.z_boundary))
 GROUP BY z.z_zonekey, z.z_name
 ORDER BY trip_count DESC, z.z_zonekey ASC
-               """
+""")
 
-    @staticmethod
-    def q5() -> str:
-        return """
+_Q5 = _sql("""
 -- Q5: Monthly travel patterns for repeat customers (convex hull of dropoff locations)
 SELECT
    c.c_custkey, c.c_name AS customer_name,
@@ -130,11 +83,9 @@ FROM trip t JOIN customer c ON t.t_custkey = c.c_custkey
 GROUP BY c.c_custkey, c.c_name, pickup_month
 HAVING dropoff_count > 5 -- Only include repeat customers for meaningful hulls
 ORDER BY dropoff_count DESC, c.c_custkey ASC
-            """
+""")
 
-    @staticmethod
-    def q6() -> str:
-        return """
+_Q6 = _sql("""
 -- Q6: Zone statistics for trips intersecting a bounding box
 SELECT
    z.z_zonekey, z.z_name,
@@ -145,11 +96,9 @@ WHERE ST_Intersects(ST_GeomFromText('POLYGON((-112.2110 34.4197, -111.3110 34.41
  AND ST_Within(ST_GeomFromWKB(t.t_pickuploc), ST_GeomFromWKB(z.z_boundary))
 GROUP BY z.z_zonekey, z.z_name
 ORDER BY total_pickups DESC, z.z_zonekey ASC
-               """
+""")
 
-    @staticmethod
-    def q7() -> str:
-        return """
+_Q7 = _sql("""
 -- Q7: Detect potential route detours by comparing reported vs. geometric distances
 WITH trip_lengths AS (
    SELECT
@@ -170,21 +119,17 @@ SELECT
    t.reported_distance_m / NULLIF(t.line_distance_m, 0) AS detour_ratio
 FROM trip_lengths t
 ORDER BY detour_ratio DESC NULLS LAST, reported_distance_m DESC, t_tripkey ASC
-               """
+""")
 
-    @staticmethod
-    def q8() -> str:
-        return """
+_Q8 = _sql("""
 -- Q8: Count nearby pickups for each building within 500m radius
 SELECT b.b_buildingkey, b.b_name, COUNT(*) AS nearby_pickup_count
 FROM trip t JOIN building b ON ST_DWithin(ST_GeomFromWKB(t.t_pickuploc), ST_GeomFromWKB(b.b_boundary), 0.0045) -- ~500m
 GROUP BY b.b_buildingkey, b.b_name
 ORDER BY nearby_pickup_count DESC, b.b_buildingkey ASC
-               """
+""")
 
-    @staticmethod
-    def q9() -> str:
-        return """
+_Q9 = _sql("""
 -- Q9: Building Conflation (duplicate/overlap detection via IoU), deterministic order
 WITH b1 AS (
    SELECT b_buildingkey AS id, ST_GeomFromWKB(b_boundary) AS geom
@@ -219,11 +164,9 @@ SELECT
        END AS iou
 FROM pairs
 ORDER BY iou DESC, building_1 ASC, building_2 ASC
-               """
+""")
 
-    @staticmethod
-    def q10() -> str:
-        return """
+_Q10 = _sql("""
 -- Q10: Zone statistics for trips starting within each zone
 SELECT
    z.z_zonekey, z.z_name AS pickup_zone, AVG(t.t_dropofftime - t.t_pickuptime) AS avg_duration,
@@ -231,11 +174,9 @@ SELECT
 FROM zone z LEFT JOIN trip t ON ST_Within(ST_GeomFromWKB(t.t_pickuploc), ST_GeomFromWKB(z.z_boundary))
 GROUP BY z.z_zonekey, z.z_name
 ORDER BY avg_duration DESC NULLS LAST, z.z_zonekey ASC
-               """
+""")
 
-    @staticmethod
-    def q11() -> str:
-        return """
+_Q11 = _sql("""
 -- Q11: Count trips that cross between different zones
 SELECT COUNT(*) AS cross_zone_trip_count
 FROM
@@ -243,12 +184,9 @@ FROM
        JOIN zone pickup_zone ON ST_Within(ST_GeomFromWKB(t.t_pickuploc), ST_GeomFromWKB(pickup_zone.z_boundary))
        JOIN zone dropoff_zone ON ST_Within(ST_GeomFromWKB(t.t_dropoffloc), ST_GeomFromWKB(dropoff_zone.z_boundary))
 WHERE pickup_zone.z_zonekey != dropoff_zone.z_zonekey
-               """
+""")
 
-    @staticmethod
-    def q12() -> str:
-        # There is some odd bug with missing columns in EMR. Using CTEs to work around it.
-        return """
+_Q12 = _sql("""
 -- Q12: Find 5 nearest buildings to each trip pickup location using KNN join
 WITH trip_with_geom AS (
    SELECT t_tripkey, t_pickuploc, ST_GeomFromWKB(t_pickuploc) as pickup_geom
@@ -267,24 +205,10 @@ SELECT
 FROM trip_with_geom t JOIN building_with_geom b
                           ON ST_KNN(t.pickup_geom, b.boundary_geom, 5, FALSE)
 ORDER BY distance_to_building ASC, b.b_buildingkey ASC
-               """
-
-
-class DatabricksSpatialBenchBenchmark(SpatialBenchBenchmark):
-    """A Databricks-specific implementation of the SpatialBench benchmark.
-
-    This class is used to run the SpatialBench benchmark using Databricks' spatial functions. It varies only as
-    needed from the base class.
+""")
 
-    """
-
-    def dialect(self) -> str:
-        """Return the dialect of the benchmark."""
-        return "Databricks"
 
-    @staticmethod
-    def q5() -> str:
-        return """
+_Q5_DATABRICKS = _sql("""
 -- Q5 (Databricks): NO ST_Collect function, using ST_Union_Agg instead. This is more expensive, but should give the same results.
 SELECT
    c.c_custkey, c.c_name AS customer_name,
@@ -295,11 +219,9 @@ FROM trip t JOIN customer c ON t.t_custkey = c.c_custkey
 GROUP BY c.c_custkey, c.c_name, pickup_month
 HAVING dropoff_count > 5 -- Only include repeat customers for meaningful hulls
 ORDER BY dropoff_count DESC, c.c_custkey ASC
-               """
+""")
 
-    @staticmethod
-    def q7() -> str:
-        return """
+_Q7_DATABRICKS = _sql("""
 -- Q7 (Databricks): ST_MakeLine takes an array of points rather than varargs
 WITH trip_lengths AS (
    SELECT
@@ -322,11 +244,9 @@ SELECT
    t.reported_distance_m / NULLIF(t.line_distance_m, 0) AS detour_ratio
 FROM trip_lengths t
 ORDER BY detour_ratio DESC NULLS LAST, reported_distance_m DESC, t_tripkey ASC
-               """
+""")
 
-    @staticmethod
-    def q12() -> str:
-        return """
+_Q12_DATABRICKS = _sql("""
 -- Q12 (Databricks): No KNN join, using cross join + ROW_NUMBER() window function instead.
 -- Note: Databricks doesn't have  cross join lateral support.
 SELECT
@@ -351,23 +271,10 @@ FROM (
     ) AS ranked_buildings
 WHERE rn <= 5
 ORDER BY distance_to_building ASC, b_buildingkey ASC
-               """
+""")
 
 
-class DuckDBSpatialBenchBenchmark(SpatialBenchBenchmark):
-    """A DuckDB-specific implementation of the SpatialBench benchmark.
-
-    This class is used to run the SpatialBench benchmark using DuckDB's spatial extension. It varies only as
-    needed from the base class.
-    """
-
-    def dialect(self) -> str:
-        """Return the dialect of the benchmark."""
-        return "DuckDB"
-
-    @staticmethod
-    def q12() -> str:
-        return """
+_Q12_DUCKDB = _sql("""
 -- Q12 (DuckDB): No KNN join, using cross join lateral instead.
 SELECT
    t.t_tripkey,
@@ -386,24 +293,10 @@ FROM trip t
        LIMIT 5
 ) AS nb
 ORDER BY nb.distance_to_building, nb.b_buildingkey
-               """
-
+""")
 
-class SedonaDBSpatialBenchBenchmark(SpatialBenchBenchmark):
-    """A SedonaDB-specific implementation of the SpatialBench benchmark.
 
-    This class is used to run the SpatialBench benchmark using SedonaDB's spatial functions.
-    It inherits from the SpatialBenchBenchmark class and uses SedonaDB's spatial functions.
-
-    """
-
-    def dialect(self) -> str:
-        """Return the dialect of the benchmark."""
-        return "SedonaDB"
-
-    @staticmethod
-    def q5() -> str:
-        return """
+_Q5_SEDONADB = _sql("""
 -- Q5 (SedonaDB): SedonaDB uses ST_Collect_Agg (with _Agg suffix) for aggregate functions.
 SELECT
     c.c_custkey, c.c_name AS customer_name,
@@ -414,23 +307,10 @@ FROM trip t JOIN customer c ON t.t_custkey = c.c_custkey
 GROUP BY c.c_custkey, c.c_name, pickup_month
 HAVING dropoff_count > 5 -- Only include repeat customers for meaningful hulls
 ORDER BY dropoff_count DESC, c.c_custkey ASC
-               """
-
-
-class PgStromSpatialBenchBenchmark(SpatialBenchBenchmark):
-    """A PG-Strom-specific implementation of the SpatialBench benchmark.
+""")
 
-    PG-Strom uses PostGIS syntax but performs best when ST_GeomFromWKB is removed
-    to allow the GPU to access native geometry types directly.
-    """
-
-    def dialect(self) -> str:
-        """Return the dialect of the benchmark."""
-        return "PgStrom"
 
-    @staticmethod
-    def q1() -> str:
-        return """
+_Q1_PGSTROM = _sql("""
 -- Q1: Find trips starting within 50km of Sedona city center
 SELECT
    t.t_tripkey, ST_X(t.t_pickuploc) AS pickup_lon, ST_Y(t.t_pickuploc) AS pickup_lat, t.t_pickuptime,
@@ -438,20 +318,16 @@ SELECT
 FROM trip t
 WHERE ST_DWithin(t.t_pickuploc, ST_GeomFromText('POINT (-111.7610 34.8697)', 4326), 0.45)
 ORDER BY distance_to_center ASC, t.t_tripkey ASC
-               """
+""")
 
-    @staticmethod
-    def q2() -> str:
-        return """
+_Q2_PGSTROM = _sql("""
 -- Q2: Count trips starting within Coconino County (Arizona) zone
 SELECT COUNT(*) AS trip_count_in_coconino_county
 FROM trip t
 WHERE ST_Intersects(t.t_pickuploc, (SELECT z.z_boundary FROM zone z WHERE z.z_name = 'Coconino County' LIMIT 1))
-               """
+""")
 
-    @staticmethod
-    def q3() -> str:
-        return """
+_Q3_PGSTROM = _sql("""
 -- Q3: Monthly trip statistics within 15km radius of Sedona city center
 SELECT
    DATE_TRUNC('month', t.t_pickuptime) AS pickup_month, COUNT(t.t_tripkey) AS total_trips,
@@ -465,11 +341,9 @@ WHERE ST_DWithin(
      )
 GROUP BY pickup_month
 ORDER BY pickup_month
-"""
+""")
 
-    @staticmethod
-    def q4() -> str:
-        return """
+_Q4_PGSTROM = _sql("""
 -- Q4: Zone distribution of top 1000 trips by tip amount
 SELECT z.z_zonekey, z.z_name, COUNT(*) AS trip_count
 FROM
@@ -482,11 +356,9 @@ FROM
    ) top_trips ON ST_Within(top_trips.t_pickuploc, z.z_boundary)
 GROUP BY z.z_zonekey, z.z_name
 ORDER BY trip_count DESC, z.z_zonekey ASC
-               """
+""")
 
-    @staticmethod
-    def q5() -> str:
-        return """
+_Q5_PGSTROM = _sql("""
 -- Q5: Monthly travel patterns for repeat customers
 SELECT
    c.c_custkey, c.c_name AS customer_name,
@@ -497,11 +369,9 @@ FROM trip t JOIN customer c ON t.t_custkey = c.c_custkey
 GROUP BY c.c_custkey, c.c_name, pickup_month
 HAVING COUNT(*) > 5
 ORDER BY dropoff_count DESC, c.c_custkey ASC
-            """
+""")
 
-    @staticmethod
-    def q6() -> str:
-        return """
+_Q6_PGSTROM = _sql("""
 -- Q6: Zone statistics for trips intersecting a bounding box
 SELECT
    z.z_zonekey, z.z_name,
@@ -512,11 +382,9 @@ WHERE ST_Intersects(ST_GeomFromText('POLYGON((-112.2110 34.4197, -111.3110 34.41
  AND ST_Within(t.t_pickuploc, z.z_boundary)
 GROUP BY z.z_zonekey, z.z_name
 ORDER BY total_pickups DESC, z.z_zonekey ASC
-               """
+""")
 
-    @staticmethod
-    def q7() -> str:
-        return """
+_Q7_PGSTROM = _sql("""
 -- Q7: Detect potential route detours
 WITH trip_lengths AS (
    SELECT
@@ -530,21 +398,17 @@ SELECT
    t.reported_distance_m / NULLIF(t.line_distance_m, 0) AS detour_ratio
 FROM trip_lengths t
 ORDER BY detour_ratio DESC NULLS LAST, reported_distance_m DESC, t_tripkey ASC
-               """
+""")
 
-    @staticmethod
-    def q8() -> str:
-        return """
+_Q8_PGSTROM = _sql("""
 -- Q8: Count nearby pickups for each building within 500m radius
 SELECT b.b_buildingkey, b.b_name, COUNT(*) AS nearby_pickup_count
 FROM trip t JOIN building b ON ST_DWithin(t.t_pickuploc, b.b_boundary, 0.0045)
 GROUP BY b.b_buildingkey, b.b_name
 ORDER BY nearby_pickup_count DESC, b.b_buildingkey ASC
-               """
+""")
 
-    @staticmethod
-    def q9() -> str:
-        return """
+_Q9_PGSTROM = _sql("""
 -- Q9: Building Conflation (duplicate/overlap detection via IoU)
 WITH pairs AS (
         SELECT
@@ -566,11 +430,9 @@ SELECT
        END AS iou
 FROM pairs
 ORDER BY iou DESC, building_1 ASC, building_2 ASC
-               """
+""")
 
-    @staticmethod
-    def q10() -> str:
-        return """
+_Q10_PGSTROM = _sql("""
 -- Q10: Zone statistics for trips starting within each zone
 SELECT
    z.z_zonekey, z.z_name AS pickup_zone, AVG(t.t_dropofftime - t.t_pickuptime) AS avg_duration,
@@ -578,11 +440,9 @@ SELECT
 FROM zone z LEFT JOIN trip t ON ST_Within(t.t_pickuploc, z.z_boundary)
 GROUP BY z.z_zonekey, z.z_name
 ORDER BY avg_duration DESC NULLS LAST, z.z_zonekey ASC
-               """
+""")
 
-    @staticmethod
-    def q11() -> str:
-        return """
+_Q11_PGSTROM = _sql("""
 -- Q11: Count trips that cross between different zones
 SELECT COUNT(*) AS cross_zone_trip_count
 FROM
@@ -590,11 +450,9 @@ FROM
        JOIN zone pickup_zone ON ST_Within(t.t_pickuploc, pickup_zone.z_boundary)
        JOIN zone dropoff_zone ON ST_Within(t.t_dropoffloc, dropoff_zone.z_boundary)
 WHERE pickup_zone.z_zonekey != dropoff_zone.z_zonekey
-               """
+""")
 
-    @staticmethod
-    def q12() -> str:
-        return """
+_Q12_PGSTROM = _sql("""
 -- Q12 (PG-Strom): KNN using CROSS JOIN LATERAL and <-> operator
 SELECT
    t.t_tripkey,
@@ -613,40 +471,122 @@ CROSS JOIN LATERAL (
    LIMIT 5
 ) AS nb
 ORDER BY nb.distance_to_building ASC, nb.b_buildingkey ASC
-               """
+""")
+
+
+# Queries are written in the Sedona/Spark SQL dialect. Because spatial functions are not as standardized as other
+# analytical functions, many engines need specific implementations of a couple of these queries where dialects vary
+# slightly; each other dialect lists only the queries it overrides.
+_QUERIES: dict[str, dict[str, str]] = {
+    # Sedona/Spark SQL; the default every other dialect falls back to
+    "SedonaSpark": {
+        "q1": _Q1,
+        "q2": _Q2,
+        "q3": _Q3,
+        "q4": _Q4,
+        "q5": _Q5,
+        "q6": _Q6,
+        "q7": _Q7,
+        "q8": _Q8,
+        "q9": _Q9,
+        "q10": _Q10,
+        "q11": _Q11,
+        "q12": _Q12,
+    },
+    # Databricks' spatial functions
+    "Databricks": {
+        "q5": _Q5_DATABRICKS,
+        "q7": _Q7_DATABRICKS,
+        "q12": _Q12_DATABRICKS,
+    },
+    # DuckDB's spatial extension
+    "DuckDB": {
+        "q12": _Q12_DUCKDB,
+    },
+    # SedonaDB's spatial functions
+    "SedonaDB": {
+        "q5": _Q5_SEDONADB,
+    },
+    # PostGIS syntax without ST_GeomFromWKB, so the GPU reads native geometry types directly
+    "PgStrom": {
+        "q1": _Q1_PGSTROM,
+        "q2": _Q2_PGSTROM,
+        "q3": _Q3_PGSTROM,
+        "q4": _Q4_PGSTROM,
+        "q5": _Q5_PGSTROM,
+        "q6": _Q6_PGSTROM,
+        "q7": _Q7_PGSTROM,
+        "q8": _Q8_PGSTROM,
+        "q9": _Q9_PGSTROM,
+        "q10": _Q10_PGSTROM,
+        "q11": _Q11_PGSTROM,
+        "q12": _Q12_PGSTROM,
+    },
+}
+
+# Full, numerically ordered query set per dialect; overrides keep the position of the query they replace
+_DIALECT_QUERIES: dict[str, dict[str, str]] = {
+    dialect: {**_QUERIES["SedonaSpark"], **overrides} for dialect, overrides in _QUERIES.items()
+}
+
+# Dialects without SQL, mapped to the Python script that implements their queries
+_SCRIPT_DIALECTS: dict[str, str] = {
+    "Geopandas": "geopandas_queries.py",
+    "Spatial Polars": "spatial_polars.py",
+}
+
+_ALL_DIALECTS = (*_QUERIES, *_SCRIPT_DIALECTS)
 
-def main():
-    query_classes = {
-        "SedonaSpark": SpatialBenchBenchmark,
-        "Databricks": DatabricksSpatialBenchBenchmark,
-        "DuckDB": DuckDBSpatialBenchBenchmark,
-        "SedonaDB": SedonaDBSpatialBenchBenchmark,
-        "PgStrom": PgStromSpatialBenchBenchmark,
-        "Geopandas": None,  # Special case, we will catch this below,
-        "Spatial Polars": None,  # Special case, we will catch this below,
-    }
 
+class SpatialBenchBenchmark:
+    """A benchmark for the performance of analytical spatial queries on a spatial dataset.
+
+    The queries of a dialect are looked up in a single table that holds the Sedona/Spark SQL queries plus, per
+    engine, only the queries whose dialect differs.
+
+    """
+
+    def __init__(self, dialect: str = "SedonaSpark") -> None:
+        if dialect not in _DIALECT_QUERIES:
+            raise ValueError(f"Unknown dialect: {dialect}")
+        self._dialect = dialect
+
+    def queries(self) -> dict[str, str]:
+        """
+        Returns the queries of this dialect, in numeric order.
+
+        Returns:
+            Dict[str, str]: A dictionary mapping query names to their SQL text.
+        """
+        return dict(_DIALECT_QUERIES[self._dialect])
+
+    def dialect(self) -> str:
+        """Return the dialect of the benchmark."""
+        return self._dialect
+
+
+def main():
     if len(sys.argv) < 2:
         print(f"Usage: {sys.argv[0]} <dialect>")
-        print(f"Available dialects: {', '.join(query_classes.keys())}")
+        print(f"Available dialects: {', '.join(_ALL_DIALECTS)}")
         sys.exit(1)
 
     dialect_arg = sys.argv[1]
 
-    if dialect_arg in ["Geopandas", "Spatial Polars"]:
-        dialect_script_name = dialect_arg.lower().replace(" ","_")
-        print(f"{dialect_arg} does not support SQL queries directly. Please use the provided Python script {dialect_script_name}.py.")
+    script_name = _SCRIPT_DIALECTS.get(dialect_arg)
+    if script_name is not None:
+        print(f"{dialect_arg} does not support SQL queries directly. Please use the provided Python script {script_name}.")
         sys.exit(0)
 
-    if dialect_arg not in query_classes:
+    if dialect_arg not in _QUERIES:
         print(f"Unknown dialect: {dialect_arg}")
-        print(f"Available dialects: {', '.join(query_classes.keys())}")
+        print(f"Available dialects: {', '.join(_ALL_DIALECTS)}")
         sys.exit(1)
 
-    queries = query_classes[dialect_arg]().queries()
+    queries = SpatialBenchBenchmark(dialect_arg).queries()
 
-    for query in queries.values():
-        print(query)
+    # The queries are stripped, so separate them with a blank line; one write for all of them
+    sys.stdout.write("\n\n".join(queries.values()) + "\n")
 
 
 if __name__ == "__main__":
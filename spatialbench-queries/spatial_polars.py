@@ -15,6 +15,7 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+import numpy as np
 import polars as pl
 import shapely
 from polars import DataFrame
@@ -27,31 +28,83 @@ import spatial_polars  # NOQA:F401 needed to add spatial namespace to polars dat
 # which is essentially the same as
 # `pip install spatial-polars scipy`
 
-def q1(data_paths: dict[str, str]) -> DataFrame:
-    """Q1 (Spatial Polars): Trips starting within 50km of Sedona city center."""
-    center_point = shapely.Point(-111.7610, 34.8697)
+
+def _read_decoded(path: str, column: str) -> DataFrame:
+    """Read a parquet table with its geometry column decoded."""
+    return (
+        pl.scan_parquet(path)
+        .with_columns(
+            pl.col(column).spatial.from_WKB(),
+        )
+        .collect(engine="streaming")
+    )
+
+
+def _load_zones(path: str) -> DataFrame:
+    """Zone table with a decoded z_boundary."""
+    return _read_decoded(path, "z_boundary")
+
+
+def _load_buildings(path: str) -> DataFrame:
+    """Building table with a decoded b_boundary."""
+    return _read_decoded(path, "b_boundary")
+
+
+def _convex_hull_area(coords: pl.Series) -> pl.Series:
+    """Convex hull area of each row of a struct of x/y coordinate lists."""
+    xs = coords.struct.field("x")
+    ys = coords.struct.field("y")
+    hulls = shapely.convex_hull(
+        shapely.multipoints(
+            np.column_stack((xs.explode().to_numpy(), ys.explode().to_numpy())),
+            indices=np.repeat(np.arange(len(coords)), xs.list.len().to_numpy()),
+            out=np.empty(len(coords), dtype=object),
+        )
+    )
+    return pl.Series(shapely.area(hulls), dtype=pl.Float64)
+
+
+def _intersection_area(pairs: pl.Series) -> pl.Series:
+    """Area of the intersection of each row of a struct of two geometry columns."""
+    left, right = (pairs.struct.field(name).spatial.to_shapely_array() for name in pairs.struct.fields)
+    return pl.Series(shapely.area(shapely.intersection(left, right)), dtype=pl.Float64)
+
+
+def q1(data_paths: dict[str, str], limit: int | None = None) -> DataFrame:
+    """Q1 (Spatial Polars): Trips starting within 50km of Sedona city center.
+
+    With ``limit`` only the first ``limit`` rows of the ordered result are kept, which
+    Polars plans as a top-k instead of a full sort.
+    """
+    center_x, center_y = -111.7610, 34.8697
 
     return (
         pl.scan_parquet(data_paths["trip"])
         .with_columns(
             pl.col("t_pickuploc").spatial.from_WKB(),
         )
-        .filter(
-            pl.col("t_pickuploc").spatial.dwithin(center_point, 0.45),
-        )
         .select(
             pl.col("t_tripkey"),
             pl.col("t_pickuploc").spatial.get_x().alias("pickup_lon"),
             pl.col("t_pickuploc").spatial.get_y().alias("pickup_lat"),
             pl.col("t_pickuptime"),
-            pl.col("t_pickuploc")
-            .spatial.distance(center_point)
+        )
+        .with_columns(
+            (
+                (pl.col("pickup_lon") - center_x).pow(2)
+                + (pl.col("pickup_lat") - center_y).pow(2)
+            )
+            .sqrt()
             .alias("distance_to_center"),
         )
+        .filter(
+            pl.col("distance_to_center") <= 0.45,
+        )
         .sort(
             "distance_to_center",
             "t_tripkey",
         )
+        .slice(0, limit)
         .collect(engine="streaming")
     )
 
@@ -63,27 +116,29 @@ def q2(data_paths: dict[str, str]) -> DataFrame:
     pickup point intersects that polygon. Returns single-row DataFrame with
     trip_count_in_coconino_county.
     """
+    boundary = (
+        pl.scan_parquet(data_paths["zone"])
+        .filter(
+            pl.col("z_name") == "Coconino County",
+        )
+        .select("z_boundary")
+        .head(1)
+        .collect(engine="streaming")
+        .get_column("z_boundary")
+    )
+    if boundary.is_empty():
+        return pl.DataFrame(
+            {"trip_count_in_coconino_county": [0]},
+            schema={"trip_count_in_coconino_county": pl.UInt32},
+        )
+    coconino_county = shapely.from_wkb(boundary.item())
     return (
         pl.scan_parquet(data_paths["trip"])
         .with_columns(
             pl.col("t_pickuploc").spatial.from_WKB(),
         )
         .filter(
-            pl.col("t_pickuploc").spatial.intersects(
-                pl.scan_parquet(data_paths["zone"])
-                .with_columns(
-                    pl.col("z_boundary").spatial.from_WKB(),
-                )
-                .filter(
-                    pl.col("z_name") == "Coconino County",
-                )
-                .select(
-                    pl.col("z_boundary"),
-                )
-                .collect(engine="streaming")
-                .to_series()
-                .spatial.to_shapely_array(),
-            ),
+            pl.col("t_pickuploc").spatial.intersects(coconino_county),
         )
         .select(
             pl.len().alias("trip_count_in_coconino_county"),
@@ -104,25 +159,22 @@ def q3(data_paths: dict[str, str]) -> DataFrame:
     Ordered by pickup_month ASC.
     Returns columns: pickup_month, total_trips, avg_distance, avg_duration, avg_fare
     """
-    bbox = shapely.Polygon(
-        (
-            (-111.9060, 34.7347),
-            (-111.6160, 34.7347),
-            (-111.6160, 35.0047),
-            (-111.9060, 35.0047),
-            (-111.9060, 34.7347),
-        )
-    )
+    # The base polygon is an axis-aligned box, so the point-to-polygon distance is the
+    # length of the per-axis overshoot beyond the box edges (zero inside)
+    minx, miny, maxx, maxy = -111.9060, 34.7347, -111.6160, 35.0047
+    pickup_x = pl.col("t_pickuploc").spatial.get_x()
+    pickup_y = pl.col("t_pickuploc").spatial.get_y()
+    dx = pl.max_horizontal(minx - pickup_x, pickup_x - maxx, 0.0)
+    dy = pl.max_horizontal(miny - pickup_y, pickup_y - maxy, 0.0)
     return (
         pl.scan_parquet(data_paths["trip"])
         .with_columns(
             pl.col("t_pickuploc").spatial.from_WKB(),
         )
         .filter(
-            pl.col("t_pickuploc").spatial.dwithin(
-                bbox,
-                0.045,
-            ),
+            # max_horizontal skips nulls and NaNs, so drop missing pickups explicitly
+            pickup_x.is_not_nan(),
+            (dx.pow(2) + dy.pow(2)).sqrt() <= 0.045,
         )
         .with_columns(
             pl.col("t_pickuptime").dt.truncate("1mo").alias("pickup_month"),
@@ -131,7 +183,7 @@ def q3(data_paths: dict[str, str]) -> DataFrame:
             "pickup_month",
         )
         .agg(
-            pl.col("t_tripkey").len().alias("total_trips"),
+            pl.len().alias("total_trips"),
             pl.col("t_distance").mean().alias("avg_distance"),
             (pl.col("t_dropofftime") - pl.col("t_pickuptime"))
             .mean()
@@ -156,23 +208,24 @@ def q4(data_paths: dict[str, str]) -> DataFrame:
     Returns columns: z_zonekey, z_name, trip_count.
     """
     return (
-        pl.scan_parquet(data_paths["zone"])
-        .with_columns(
-            pl.col("z_boundary").spatial.from_WKB(),
-        )
-        .collect(engine="streaming")
+        _load_zones(data_paths["zone"])
         .spatial.join(
             pl.scan_parquet(data_paths["trip"])
-            .with_columns(
-                pl.col("t_pickuploc").spatial.from_WKB(),
+            .select(
+                pl.col("t_tripkey"),
+                pl.col("t_tip"),
+                pl.col("t_pickuploc"),
             )
-            .collect(engine="streaming")
             .sort(
                 pl.col("t_tip"),
                 pl.col("t_tripkey"),
                 descending=[True, False],
             )
-            .head(1000),
+            .head(1000)
+            .with_columns(
+                pl.col("t_pickuploc").spatial.from_WKB(),
+            )
+            .collect(engine="streaming"),
             how="inner",
             predicate="intersects",
             left_on="z_boundary",
@@ -201,6 +254,10 @@ def q5(data_paths: dict[str, str]) -> DataFrame:
         .with_columns(
             pl.col("t_dropoffloc").spatial.from_WKB(),
         )
+        .with_columns(
+            pl.col("t_dropoffloc").spatial.get_x().alias("dropoff_x"),
+            pl.col("t_dropoffloc").spatial.get_y().alias("dropoff_y"),
+        )
         .join(
             pl.scan_parquet(data_paths["customer"]),
             how="inner",
@@ -215,16 +272,15 @@ def q5(data_paths: dict[str, str]) -> DataFrame:
         )
         .agg(
             pl.len().alias("dropoff_count"),
-            pl.col("t_dropoffloc"),
+            pl.col("dropoff_x").alias("x"),
+            pl.col("dropoff_y").alias("y"),
         )
         .filter(
             pl.col("dropoff_count") > 5,
         )
         .with_columns(
-            pl.col("t_dropoffloc")
-            .spatial.to_geometrycollection()
-            .spatial.convex_hull()
-            .spatial.area()
+            pl.struct("x", "y")
+            .map_batches(_convex_hull_area, return_dtype=pl.Float64)
             .alias("monthly_travel_hull_area"),
         )
         .select(
@@ -267,22 +323,17 @@ def q6(data_paths: dict[str, str]) -> DataFrame:
     )
 
     return (
-        pl.scan_parquet(data_paths["zone"])
-        .with_columns(
-            pl.col("z_boundary").spatial.from_WKB(),
-        )
+        _load_zones(data_paths["zone"])
+        .lazy()
         .filter(
             pl.col("z_boundary").spatial.intersects(
                 aoi,
             ),
         )
-        .collect(engine="streaming")
         .spatial.join(
-            pl.scan_parquet(data_paths["trip"])
-            .with_columns(
+            pl.scan_parquet(data_paths["trip"]).with_columns(
                 pl.col("t_pickuploc").spatial.from_WKB(),
-            )
-            .collect(engine="streaming"),
+            ),
             predicate="intersects",
             left_on="z_boundary",
             right_on="t_pickuploc",
@@ -292,7 +343,7 @@ def q6(data_paths: dict[str, str]) -> DataFrame:
             "z_name",
         )
         .agg(
-            pl.col("t_tripkey").len().alias("total_pickups"),
+            pl.len().alias("total_pickups"),
             pl.col("t_distance").mean().alias("avg_distance"),
             (pl.col("t_dropofftime") - pl.col("t_pickuptime"))
             .mean()
@@ -303,10 +354,11 @@ def q6(data_paths: dict[str, str]) -> DataFrame:
             pl.col("z_zonekey"),
             descending=[True, False],
         )
+        .collect(engine="streaming")
     )
 
 
-def q7(data_paths: dict[str, str]) -> DataFrame:
+def q7(data_paths: dict[str, str], limit: int | None = None) -> DataFrame:
     """Q7 (Spatial Polars): Detect potential route detours by comparing reported vs geometric distances.
 
     Mirrors SQL semantics:
@@ -316,6 +368,7 @@ def q7(data_paths: dict[str, str]) -> DataFrame:
       * line_distance_m = length of straight line between pickup and dropoff (meters)
       * detour_ratio = (reported_distance_m) / line_distance_m (NULL if line_distance_m==0)
       * Ordered by detour_ratio DESC, reported_distance_m DESC, t_tripkey ASC
+      * Optionally truncated to the first ``limit`` rows (planned as a top-k)
     """
     return (
         pl.scan_parquet(data_paths["trip"])
@@ -325,7 +378,17 @@ def q7(data_paths: dict[str, str]) -> DataFrame:
         )
         .with_columns(
             (
-                pl.struct(("t_pickuploc", "t_dropoffloc")).spatial.distance() * 111111
+                (
+                    (
+                        pl.col("t_pickuploc").spatial.get_x()
+                        - pl.col("t_dropoffloc").spatial.get_x()
+                    ).pow(2)
+                    + (
+                        pl.col("t_pickuploc").spatial.get_y()
+                        - pl.col("t_dropoffloc").spatial.get_y()
+                    ).pow(2)
+                ).sqrt()
+                * 111111
             ).alias("line_distance_m"),
             pl.col("t_distance").alias("reported_distance_m"),
         )
@@ -349,6 +412,7 @@ def q7(data_paths: dict[str, str]) -> DataFrame:
             descending=[True, True, False],
             nulls_last=[True, False, False],
         )
+        .slice(0, limit)
         .collect(engine="streaming")
     )
 
@@ -360,13 +424,8 @@ def q8(data_paths: dict[str, str]) -> DataFrame:
         .with_columns(
             pl.col("t_pickuploc").spatial.from_WKB(),
         )
-        .collect(engine="streaming")
         .spatial.join(
-            pl.scan_parquet(data_paths["building"])
-            .with_columns(
-                pl.col("b_boundary").spatial.from_WKB(),
-            )
-            .collect(engine="streaming"),
+            _load_buildings(data_paths["building"]).lazy(),
             left_on="t_pickuploc",
             right_on="b_boundary",
             predicate="dwithin",
@@ -384,6 +443,7 @@ def q8(data_paths: dict[str, str]) -> DataFrame:
             pl.col("b_buildingkey"),
             descending=[True, False],
         )
+        .collect(engine="streaming")
     )
 
 
@@ -395,32 +455,15 @@ def q9(data_paths: dict[str, str]) -> DataFrame:
     Output columns: building_1, building_2, area1, area2, overlap_area, iou ordered by
     iou DESC, building_1 ASC, building_2 ASC.
     """
-    building_lf = pl.scan_parquet(data_paths["building"])
-    b1_df = (
-        building_lf.with_columns(
-            pl.col("b_boundary").spatial.from_WKB(),
-        )
-        .select(
-            pl.col("b_buildingkey").alias("id"),
-            pl.col("b_boundary"),
-        )
-        .collect(engine="streaming")
-    )
-
-    b2_df = (
-        building_lf.with_columns(
-            pl.col("b_boundary").spatial.from_WKB(),
-        )
-        .select(
-            pl.col("b_buildingkey").alias("id"),
-            pl.col("b_boundary"),
-        )
-        .collect(engine="streaming")
+    building_df = _load_buildings(data_paths["building"]).select(
+        pl.col("b_buildingkey").alias("id"),
+        pl.col("b_boundary"),
+        pl.col("b_boundary").spatial.area().alias("b_area"),
     )
 
     return (
-        b1_df.spatial.join(
-            b2_df,
+        building_df.spatial.join(
+            building_df,
             predicate="intersects",
             on="b_boundary",
             suffix=("_2"),
@@ -431,11 +474,10 @@ def q9(data_paths: dict[str, str]) -> DataFrame:
         .select(
             pl.col("id").alias("building_1"),
             pl.col("id_2").alias("building_2"),
-            pl.col("b_boundary").spatial.area().alias("area1"),
-            pl.col("b_boundary_2").spatial.area().alias("area2"),
+            pl.col("b_area").alias("area1"),
+            pl.col("b_area_2").alias("area2"),
             pl.struct(("b_boundary", "b_boundary_2"))
-            .spatial.intersection()
-            .spatial.area()
+            .map_batches(_intersection_area, return_dtype=pl.Float64)
             .alias("overlap_area"),
         )
         .with_columns(
@@ -464,17 +506,12 @@ def q10(data_paths: dict[str, str]) -> DataFrame:
     Zones with zero trips retained (avg_* = NaN, num_trips = 0).
     """
     return (
-        pl.scan_parquet(data_paths["zone"])
-        .with_columns(
-            pl.col("z_boundary").spatial.from_WKB(),
-        )
-        .collect(engine="streaming")
+        _load_zones(data_paths["zone"])
+        .lazy()
         .spatial.join(
-            pl.scan_parquet(data_paths["trip"])
-            .with_columns(
+            pl.scan_parquet(data_paths["trip"]).with_columns(
                 pl.col("t_pickuploc").spatial.from_WKB(),
-            )
-            .collect(engine="streaming"),
+            ),
             left_on="z_boundary",
             right_on="t_pickuploc",
             predicate="intersects",
@@ -497,6 +534,7 @@ def q10(data_paths: dict[str, str]) -> DataFrame:
             descending=[True, False],
             nulls_last=[True, False],
         )
+        .collect(engine="streaming")
     )
 
 
@@ -507,38 +545,43 @@ def q11(data_paths: dict[str, str]) -> DataFrame:
     """
     trip_df = (
         pl.scan_parquet(data_paths["trip"])
-        .with_columns(
-            pl.col("t_pickuploc").spatial.from_WKB(),
-            pl.col("t_dropoffloc").spatial.from_WKB(),
+        .select(
+            pl.col("t_pickuploc"),
+            pl.col("t_dropoffloc"),
         )
         .collect(engine="streaming")
     )
+    zone_df = _load_zones(data_paths["zone"])
 
-    zone_df = (
-        pl.scan_parquet(data_paths["zone"])
-        .with_columns(
-            pl.col("z_boundary").spatial.from_WKB(),
-        )
-        .collect(engine="streaming")
+    # Index pickups and dropoffs together in one tree and probe it once with the
+    # (prepared) zone polygons; point i < n is trip i's pickup, i >= n its dropoff
+    n = trip_df.height
+    points = shapely.from_wkb(
+        pl.concat([trip_df["t_pickuploc"], trip_df["t_dropoffloc"]]).to_numpy()
+    )
+    zone_index, point_index = shapely.STRtree(points).query(
+        zone_df["z_boundary"].spatial.to_shapely_array(),
+        predicate="contains",
+    )
+    matches = pl.DataFrame(
+        {
+            "trip_index": point_index % n,
+            "is_pickup": point_index < n,
+            "z_zonekey": zone_df["z_zonekey"].to_numpy()[zone_index],
+        }
     )
 
     return (
-        zone_df.spatial.join(
-            zone_df.spatial.join(
-                trip_df,
-                how="inner",
-                left_on="z_boundary",
-                right_on="t_pickuploc",
-                predicate="contains",
-            ),
-            how="inner",
-            left_on="z_boundary",
-            right_on="t_dropoffloc",
-            predicate="contains",
+        matches.filter(pl.col("is_pickup"))
+        .join(
+            matches.filter(~pl.col("is_pickup")),
+            on="trip_index",
             suffix="_dropoff",
-        ).filter(
+        )
+        .filter(
             pl.col("z_zonekey") != pl.col("z_zonekey_dropoff"),
-        ).select(
+        )
+        .select(
             pl.len().alias("cross_zone_trip_count"),
         )
     )
@@ -572,6 +615,7 @@ def q12(data_paths: dict[str, str]) -> DataFrame:
             left_on="pickup_geom",
             right_on="boundary_geom",
             k=5,
+            left_all_points=True,
         )
         .lazy()
         .select(
@@ -591,3 +635,19 @@ def q12(data_paths: dict[str, str]) -> DataFrame:
         )
         .collect(engine="streaming")
     )
+
+
+QUERIES = {
+    "q1": q1,
+    "q2": q2,
+    "q3": q3,
+    "q4": q4,
+    "q5": q5,
+    "q6": q6,
+    "q7": q7,
+    "q8": q8,
+    "q9": q9,
+    "q10": q10,
+    "q11": q11,
+    "q12": q12,
+}